@@ -6,20 +6,23 @@ FIXED VERSION - All errors resolved
 
 import streamlit as st
 import pandas as pd
-import json
+import numpy as np
+import orjson
+import csv
+import io
 import os
-from pathlib import Path
-import plotly.graph_objects as go
-import plotly.express as px
+import time
+import uuid
+import multiprocessing
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from resume_parser import ResumeParser
-from job_resume_matcher import CandidateRanker, JobDescriptionParser
+from job_resume_matcher import CandidateRanker, JobDescriptionParser, init_rank_worker
+from content_hash import content_digest
 from datetime import datetime
-from email_integration import EmailManager, render_email_panel
-from bulk_upload import render_bulk_upload_ui
-from interview_questions import render_question_generator_ui
-from database import SupabaseManager
 from authentication import (
-    AuthManager, 
+    get_auth_manager, 
     render_auth_page, 
     render_auth_sidebar, 
     require_auth
@@ -75,58 +78,461 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# ==================== SHARED RESOURCES ====================
+# Parsers hold loaded NLP models, so build them once per process
+
+@st.cache_resource
+def _get_parser():
+    """Shared resume parser"""
+    return ResumeParser()
+
+
+@st.cache_resource
+def _get_ranker():
+    """Shared candidate ranker"""
+    return CandidateRanker()
+
+
+@st.cache_resource
+def _get_ranking_pool() -> ProcessPoolExecutor:
+    """Ranking process pool kept across reruns, so workers keep their models"""
+    # spawn, not fork: forking the multi-threaded Streamlit server can deadlock
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=init_rank_worker
+    )
+
+
+@st.cache_resource
+def _get_job_parser():
+    """Shared job description parser"""
+    return JobDescriptionParser()
+
+
+@st.cache_resource
+def _get_db():
+    """Shared Supabase manager, or None if the database is unreachable"""
+    from database import SupabaseManager
+    
+    try:
+        db = SupabaseManager()
+    except Exception as e:
+        st.error(f"⚠️ Database connection failed: {str(e)}")
+        st.info("The app will continue with limited functionality (no persistence).")
+        return None
+    
+    # Every write, including the bulk upload page's, drops the cached reads below
+    db.write_hooks.append(_clear_db_read_caches)
+    return db
+
+
+# ==================== CACHED DATABASE READS ====================
+# Dashboard and history reads are reused for DB_CACHE_TTL seconds so page
+# navigation doesn't hit Supabase on every rerun; SupabaseManager writes
+# clear them through its write_hooks
+
+DB_CACHE_TTL = 60
+
+
+@st.cache_data(ttl=DB_CACHE_TTL, show_spinner=False)
+def _cached_job_postings():
+    """All job postings, newest first, with their display strings prepared"""
+    jobs = _get_db().get_all_job_postings()
+    for job in jobs:
+        job['created_date'] = job['created_at'][:10]
+        job['description_preview'] = job['description'][:300] + "..."
+    return jobs
+
+
+@st.cache_data(ttl=DB_CACHE_TTL, show_spinner=False)
+def _cached_analytics_summary():
+    """Database-wide resume, job and ranking counts"""
+    return _get_db().get_analytics_summary()
+
+
+@st.cache_data(ttl=DB_CACHE_TTL, show_spinner=False)
+def _cached_rankings_by_job(job_id):
+    """Stored rankings for one job posting"""
+    return _get_db().get_rankings_by_job(job_id)
+
+
+def _clear_db_read_caches():
+    """Drop cached database reads after a write"""
+    _cached_job_postings.clear()
+    _cached_analytics_summary.clear()
+    _cached_rankings_by_job.clear()
+
+
+# Sidebar logo, inlined so first paint doesn't wait on an external image host
+_LOGO_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="200" height="80" viewBox="0 0 200 80">
+<rect width="200" height="80" fill="#667eea"/>
+<text x="100" y="40" fill="#ffffff" font-family="sans-serif" font-size="20"
+ text-anchor="middle" dominant-baseline="central">AI Recruiter</text>
+</svg>"""
+
+# Rankings page sort options mapped to candidate score fields
+SORT_FIELDS = {
+    'Overall Score': 'overall_score',
+    'Skills Score': 'skills_score',
+    'Experience Score': 'experience_score'
+}
+
+# Candidate fields kept in the rankings table frame, with their display headers
+RANKING_TABLE_COLUMNS = {
+    'name': 'Name',
+    'overall_score': 'Overall Score',
+    'skills_score': 'Skills Score',
+    'experience_score': 'Experience Score',
+    'education_score': 'Education Score',
+    'total_experience': 'Experience (years)'
+}
+
+# Ranking fields read back from the database when reloading a past job
+STORED_RANKING_FIELDS = [
+    'overall_score', 'skills_score', 'experience_score', 'education_score',
+    'matched_skills', 'missing_skills', 'explanation'
+]
+
+# Expanders rendered per page in the parsed resume and history lists
+LIST_PAGE_SIZE = 10
+
+# Minimum seconds between upload progress updates sent to the browser
+PROGRESS_INTERVAL = 0.25
+
+# Column headers for the rankings CSV report
+CSV_REPORT_COLUMNS = [
+    'Name', 'Email', 'Phone', 'Overall Score', 'Skills Score',
+    'Experience Score', 'Education Score', 'Total Experience',
+    'Matched Skills', 'Missing Skills'
+]
+
+# Score histogram buckets: 0-10, 10-20, ..., 90-100
+SCORE_BIN_EDGES = np.linspace(0, 100, 11)
+
+# Sample job description used by the "Use Sample Job" button
+_SAMPLE_JD = """Senior Python Developer
+
+We are seeking an experienced Python Developer to join our AI/ML team.
+
+Requirements:
+- 3-5 years of professional Python development experience
+- Strong experience with Machine Learning frameworks (TensorFlow, PyTorch)
+- Experience with cloud platforms (AWS preferred)
+- Bachelor's degree in Computer Science or related field
+
+Must Have Skills:
+- Python (expert level)
+- Machine Learning & Deep Learning
+- TensorFlow or PyTorch
+- SQL databases (MySQL, PostgreSQL)
+- REST API development
+- Git version control
+
+Nice to Have:
+- AWS/Azure/GCP experience
+- Docker and Kubernetes
+- React or frontend experience
+- Experience with NLP projects
+- CI/CD pipelines
+
+Responsibilities:
+- Develop and deploy machine learning models
+- Build scalable ML pipelines
+- Collaborate with data scientists and engineers
+- Write clean, maintainable, well-documented code
+- Participate in code reviews
+"""
+
+
+# Bounds for the parse caches; every keystroke in the job text area is a new key
+JOB_PARSE_CACHE_ENTRIES = 64
+RESUME_PARSE_CACHE_ENTRIES = 512
+RANKING_CACHE_ENTRIES = 32
+
+
+@st.cache_data(show_spinner=False, max_entries=JOB_PARSE_CACHE_ENTRIES)
+def _parse_job(job_description: str) -> dict:
+    """Parse a job description once per unique text"""
+    return _get_job_parser().parse_job_description(job_description)
+
+
+@st.cache_data(show_spinner=False, max_entries=RESUME_PARSE_CACHE_ENTRIES)
+def _parse_resume_upload(content_hash: str, _upload) -> dict:
+    """Parse a resume once per unique file content (keyed on its hash)"""
+    # The upload is already in memory, so it is parsed straight from the buffer
+    return _get_parser().parse_resume_stream(_upload, _upload.name)
+
+
+@st.cache_data(show_spinner=False, max_entries=RANKING_CACHE_ENTRIES)
+def _rank_resumes(resume_keys: tuple, job_description: str, _resumes) -> list:
+    """Rank resumes once per (resume set, job text); resumes are keyed by content hash"""
+    pool = _get_ranking_pool()
+    try:
+        return _get_ranker().rank_candidates_parallel(_resumes, job_description, pool)
+    except BrokenProcessPool:
+        # A worker died; retire the pool and rank this set serially
+        pool.shutdown(wait=False, cancel_futures=True)
+        _get_ranking_pool.clear()
+        return _get_ranker().rank_candidates(_resumes, job_description)
+
+
+@st.cache_data(show_spinner=False, max_entries=RESUME_PARSE_CACHE_ENTRIES)
+def _resume_aggregates(resume_keys: tuple, _resumes) -> dict:
+    """Resume count and mean experience, keyed on the resumes' content hashes"""
+    experience = np.fromiter(
+        (r.get('total_experience_years', 0) for r in _resumes.values()),
+        dtype=float,
+        count=len(_resumes)
+    )
+    return {
+        'count': int(experience.size),
+        'avg_experience': float(experience.mean()) if experience.size else 0.0
+    }
+
+
+def _add_skill_summary(resume_data):
+    """Attach the flattened skill list and its size so renders don't recompute them"""
+    resume_data['_flat_skills'] = list(chain.from_iterable(resume_data.get('skills', {}).values()))
+    resume_data['_total_skills'] = len(resume_data['_flat_skills'])
+    return resume_data
+
+
+# ==================== CACHED FIGURES ====================
+# Figures are rebuilt only when the values they plot change, not on every rerun;
+# plotly is imported inside them, so pages without charts never load it
+
+# One breakdown per distinct score triple; the page charts change per ranking set
+BREAKDOWN_FIG_CACHE_ENTRIES = 512
+PAGE_FIG_CACHE_ENTRIES = 32
+
+
+@st.cache_data(show_spinner=False, max_entries=BREAKDOWN_FIG_CACHE_ENTRIES)
+def _score_breakdown_fig(skills_score: float, experience_score: float, education_score: float):
+    """Score breakdown bar chart for a single candidate"""
+    import plotly.express as px
+    
+    scores_df = pd.DataFrame({
+        'Category': ['Skills', 'Experience', 'Education'],
+        'Score': [skills_score, experience_score, education_score]
+    })
+    
+    fig = px.bar(
+        scores_df,
+        x='Category',
+        y='Score',
+        color='Score',
+        color_continuous_scale='RdYlGn',
+        range_color=[0, 100]
+    )
+    fig.update_layout(height=250, showlegend=False)
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=PAGE_FIG_CACHE_ENTRIES)
+def _score_histogram_fig(scores):
+    """Overall score distribution histogram"""
+    import plotly.graph_objects as go
+    
+    # Bin into fixed 10-point buckets here so Plotly only draws precomputed bars
+    counts, edges = np.histogram(scores, bins=SCORE_BIN_EDGES)
+    fig = go.Figure(data=[go.Bar(
+        x=edges[:-1] + 5,
+        y=counts,
+        width=10,
+        marker_color='#667eea'
+    )])
+    fig.update_layout(
+        title="Candidate Score Distribution",
+        xaxis_title="Overall Score",
+        yaxis_title="Number of Candidates",
+        height=350
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=PAGE_FIG_CACHE_ENTRIES)
+def _skills_bar_fig(top_skills, color=None):
+    """Horizontal bar chart of (skill, count) pairs"""
+    import plotly.express as px
+    
+    skills, counts = zip(*top_skills)
+    fig = px.bar(
+        x=counts,
+        y=skills,
+        orientation='h',
+        labels={'x': 'Count', 'y': 'Skill'},
+        color_discrete_sequence=[color] if color else None
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+def _top_skills(skill_lists: pd.Series, n: int = 10) -> list:
+    """Most frequent skills across a column of skill lists, as (skill, count) pairs"""
+    # explode flattens the lists and value_counts tallies them without a Python loop
+    counts = skill_lists.explode().dropna().value_counts().head(n)
+    return list(counts.items())
+
+
+@st.cache_data(show_spinner=False, max_entries=PAGE_FIG_CACHE_ENTRIES)
+def _experience_scatter_fig(exp_data):
+    """Experience vs overall score scatter plot"""
+    import plotly.express as px
+    
+    fig = px.scatter(
+        exp_data,
+        x='Experience',
+        y='Score',
+        hover_data=['Name'],
+        color='Score',
+        color_continuous_scale='RdYlGn'
+    )
+    # A constant marker size, rather than a size column of N identical values
+    fig.update_traces(marker=dict(size=10))
+    fig.update_layout(height=400)
+    return fig
+
+
+# ==================== CACHED REPORTS ====================
+# Reports are keyed on the rankings_key token set by store_rankings, so each
+# ranking set is serialized once rather than on every rerun. Tokens are never
+# reused, so entries are bounded and expire instead of piling up
+REPORT_CACHE_ENTRIES = 16
+REPORT_CACHE_TTL = 600
+
+
+def _report_file_name(extension: str) -> str:
+    """Report filename stamped with the time the current ranking was made"""
+    return f"ranking_report_{st.session_state.ranked_at.strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+
+@st.cache_data(show_spinner=False, max_entries=REPORT_CACHE_ENTRIES, ttl=REPORT_CACHE_TTL)
+def _build_json_report(rankings_key: str, ranked_at: datetime, _candidates) -> bytes:
+    """Serialize ranked candidates to a JSON report"""
+    report_data = {
+        'generated_at': ranked_at.isoformat(),
+        'total_candidates': len(_candidates),
+        'candidates': _candidates
+    }
+    
+    return orjson.dumps(
+        report_data,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=REPORT_CACHE_ENTRIES, ttl=REPORT_CACHE_TTL)
+def _build_csv_report(rankings_key: str, _candidates) -> str:
+    """Flatten ranked candidates to a CSV report"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_REPORT_COLUMNS)
+    
+    # One writerows call over a generator; no intermediate DataFrame or row list
+    writer.writerows(
+        (
+            c['name'],
+            c['email'],
+            c['phone'],
+            c['overall_score'],
+            c['skills_score'],
+            c['experience_score'],
+            c['education_score'],
+            c.get('total_experience', 0),
+            ', '.join(c.get('matched_skills', [])[:5]),
+            ', '.join(c.get('missing_skills', [])[:5])
+        )
+        for c in _candidates
+    )
+    
+    return buffer.getvalue()
+
+
 class ResumeShortlistingApp:
     """Main application class for the web interface"""
     
     def __init__(self):
-        self.parser = ResumeParser()
-        self.ranker = CandidateRanker()
-        self.job_parser = JobDescriptionParser()
+        self.parser = _get_parser()
+        self.ranker = _get_ranker()
+        self.job_parser = _get_job_parser()
         
-        # Initialize database with error handling
-        try:
-            self.db = SupabaseManager()
-            self.db_available = True
-        except Exception as e:
-            st.error(f"⚠️ Database connection failed: {str(e)}")
-            st.info("The app will continue with limited functionality (no persistence).")
-            self.db_available = False
-            self.db = None
+        self.db = _get_db()
+        self.db_available = self.db is not None
         
         # Initialize authentication
         try:
-            self.auth_manager = AuthManager()
+            self.auth_manager = get_auth_manager()
         except Exception as e:
             st.warning(f"Authentication initialization warning: {str(e)}")
             self.auth_manager = None
-        
-        # Initialize session state
-        self._initialize_session_state()
     
     def _initialize_session_state(self):
         """Initialize all session state variables"""
         defaults = {
-            'parsed_resumes': [],
+            'parsed_resumes': {},
             'ranked_candidates': [],
+            'ranked_df': None,
+            'sort_indices': {},
+            'excellent_count': None,
+            'rankings_key': None,
+            'ranked_at': None,
             'job_description': "",
             'current_job_id': None,
             'current_job_title': "",
             'page': 'Dashboard',
             'authenticated': False,
-            'user_email': None
+            'user_email': None,
+            'user': None,
+            'access_token': None
         }
         
         for key, value in defaults.items():
             if key not in st.session_state:
                 st.session_state[key] = value
     
+    def store_rankings(self, ranked):
+        """Store ranked candidates; sort orders are built on first use"""
+        st.session_state.ranked_candidates = ranked
+        st.session_state.rankings_key = uuid.uuid4().hex
+        st.session_state.ranked_at = datetime.now()
+        st.session_state.sort_indices = {}
+        
+        # Columnar copy of the scores so filtering and sorting run vectorized
+        ranked_df = pd.DataFrame(ranked, columns=list(RANKING_TABLE_COLUMNS))
+        ranked_df['total_experience'] = ranked_df['total_experience'].fillna(0)
+        st.session_state.ranked_df = ranked_df
+        
+        # Sidebar stat counted once per ranking rather than on every rerun
+        st.session_state.excellent_count = int((ranked_df['overall_score'] >= 80).sum())
+    
+    def sort_order(self, label):
+        """Candidate indices ordered by a SORT_FIELDS score, cached per ranking"""
+        orders = st.session_state.sort_indices
+        if label not in orders:
+            scores = st.session_state.ranked_df[SORT_FIELDS[label]].to_numpy()
+            orders[label] = np.argsort(-scores, kind='stable')
+        return orders[label]
+    
+    def load_stored_rankings(self, rankings_data):
+        """Load rankings saved in the database as the current ranking set"""
+        # Build the columns in one frame instead of a dict per stored row
+        formatted = pd.DataFrame(rankings_data, columns=STORED_RANKING_FIELDS)
+        score_columns = ['skills_score', 'experience_score', 'education_score']
+        formatted[score_columns] = formatted[score_columns].fillna(0)
+        formatted.insert(0, 'name', [f"Candidate #{idx}" for idx in range(1, len(formatted) + 1)])
+        formatted = formatted.assign(email='N/A', phone='N/A', total_experience=0)
+        self.store_rankings(formatted.to_dict('records'))
+    
     def navigate_to(self, page_name):
-        """Safe navigation helper"""
+        """Button callback that switches page; the click's own rerun renders it"""
         st.session_state.page = page_name
-        st.rerun()
     
     def run(self):
         """Main application runner"""
+        # The app object is shared across sessions, so seed this session's state here
+        self._initialize_session_state()
         
         # Check authentication first (if available)
         if self.auth_manager and not self.auth_manager.is_authenticated():
@@ -167,8 +573,7 @@ class ResumeShortlistingApp:
         """Render sidebar navigation"""
         with st.sidebar:
             # Logo - Fixed: removed use_container_width parameter
-            st.image("https://via.placeholder.com/200x80/667eea/ffffff?text=AI+Recruiter", 
-                    width=200)
+            st.image(_LOGO_SVG, width=200)
             st.markdown("---")
             
             # Navigation using callback to avoid state modification error
@@ -197,10 +602,10 @@ class ResumeShortlistingApp:
                 index=pages.index(current_page) if current_page in pages else 0
             )
             
-            # Update page if changed
+            # Update page if changed; routing happens after the sidebar, so the
+            # new page renders in this same run
             if selected_page != current_page:
                 st.session_state.page = selected_page
-                st.rerun()
             
             st.markdown("---")
             
@@ -209,28 +614,32 @@ class ResumeShortlistingApp:
             st.metric("Resumes Uploaded", len(st.session_state.parsed_resumes))
             
             if st.session_state.ranked_candidates:
-                excellent = sum(1 for c in st.session_state.ranked_candidates 
-                              if c['overall_score'] >= 80)
-                st.metric("Excellent Matches", excellent)
+                st.metric("Excellent Matches", st.session_state.excellent_count)
             
             st.markdown("---")
             
             # Clear data button with callback
             def clear_all_data():
-                st.session_state.parsed_resumes = []
+                st.session_state.parsed_resumes = {}
                 st.session_state.ranked_candidates = []
+                st.session_state.ranked_df = None
+                st.session_state.sort_indices = {}
+                st.session_state.excellent_count = None
+                st.session_state.rankings_key = None
+                st.session_state.ranked_at = None
                 st.session_state.job_description = ""
                 st.session_state.current_job_id = None
                 st.session_state.current_job_title = ""
             
             if st.button("🗑️ Clear All Data", use_container_width=True, on_click=clear_all_data):
                 st.success("Data cleared!")
-                st.rerun()
     
     # ==================== NEW PAGES ====================
     
     def page_bulk_upload(self):
         """Bulk resume upload page"""
+        from bulk_upload import render_bulk_upload_ui
+        
         try:
             render_bulk_upload_ui(self.parser, self.db if self.db_available else None)
         except Exception as e:
@@ -239,10 +648,11 @@ class ResumeShortlistingApp:
 
     def page_send_emails(self):
         """Email sending page"""
+        from email_integration import render_email_panel
+        
         if not st.session_state.ranked_candidates:
             st.warning("⚠️ No candidates to email. Please rank candidates first!")
-            if st.button("Go to Rankings"):
-                self.navigate_to('Rankings')
+            st.button("Go to Rankings", on_click=self.navigate_to, args=('Rankings',))
             return
         
         try:
@@ -263,25 +673,29 @@ class ResumeShortlistingApp:
 
     def page_interview_questions(self):
         """Interview questions page"""
+        from interview_questions import render_question_generator_ui
+        
         st.header("🎯 Generate Interview Questions")
         
         if not st.session_state.ranked_candidates:
             st.warning("⚠️ No candidates available. Please rank candidates first!")
-            if st.button("Go to Rankings"):
-                self.navigate_to('Rankings')
+            st.button("Go to Rankings", on_click=self.navigate_to, args=('Rankings',))
             return
         
         # Select candidate
         st.markdown("### Select Candidate")
         
-        candidate_names = [c['name'] for c in st.session_state.ranked_candidates]
-        selected_name = st.selectbox("Choose candidate:", candidate_names)
+        # Options are list positions, so the pick is an O(1) index and
+        # candidates sharing a name stay distinct
+        ranked = st.session_state.ranked_candidates
+        selected_index = st.selectbox(
+            "Choose candidate:",
+            range(len(ranked)),
+            format_func=lambda i: ranked[i]['name']
+        )
         
-        if selected_name:
-            selected_candidate = next(
-                c for c in st.session_state.ranked_candidates 
-                if c['name'] == selected_name
-            )
+        if selected_index is not None:
+            selected_candidate = ranked[selected_index]
             
             job_title = st.text_input(
                 "Job Title",
@@ -301,7 +715,7 @@ class ResumeShortlistingApp:
         # Get stats from database if available, otherwise from session
         if self.db_available:
             try:
-                stats = self.db.get_analytics_summary()
+                stats = _cached_analytics_summary()
             except Exception as e:
                 st.warning(f"Could not load database stats: {str(e)}")
                 stats = {
@@ -332,7 +746,7 @@ class ResumeShortlistingApp:
         
         if self.db_available:
             try:
-                jobs = self.db.get_all_job_postings()
+                jobs = _cached_job_postings()
                 
                 if jobs:
                     for job in jobs[:5]:
@@ -340,7 +754,7 @@ class ResumeShortlistingApp:
                         with col_a:
                             st.write(f"**{job['title']}**")
                         with col_b:
-                            st.write(job['created_at'][:10])
+                            st.write(job['created_date'])
                 else:
                     st.info("No jobs yet! Go to Job Description tab to create one.")
             except Exception as e:
@@ -356,12 +770,11 @@ class ResumeShortlistingApp:
         if not self.db_available:
             st.warning("⚠️ Database not available. History feature requires database connection.")
             st.info("Recent rankings are available in the Rankings tab.")
-            if st.button("Go to Rankings"):
-                self.navigate_to('Rankings')
+            st.button("Go to Rankings", on_click=self.navigate_to, args=('Rankings',))
             return
         
         try:
-            jobs = self.db.get_all_job_postings()
+            jobs = _cached_job_postings()
         except Exception as e:
             st.error(f"Failed to load job history: {str(e)}")
             st.info("""
@@ -380,17 +793,17 @@ class ResumeShortlistingApp:
         
         if not jobs:
             st.info("No history yet. Match some candidates first!")
-            if st.button("Go to Job Description"):
-                self.navigate_to('Job Description')
+            st.button("Go to Job Description", on_click=self.navigate_to, args=('Job Description',))
             return
         
-        for job in jobs:
-            with st.expander(f"📋 {job['title']} ({job['created_at'][:10]})"):
+        start, stop = self.paginate(len(jobs), key="history_page")
+        for job in jobs[start:stop]:
+            with st.expander(f"📋 {job['title']} ({job['created_date']})"):
                 st.markdown(f"**Job Description:**")
-                st.text(job['description'][:300] + "...")
+                st.text(job['description_preview'])
                 
                 try:
-                    rankings = self.db.get_rankings_by_job(job['id'])
+                    rankings = _cached_rankings_by_job(job['id'])
                 except Exception as e:
                     st.warning(f"Could not load rankings: {str(e)}")
                     rankings = []
@@ -402,37 +815,18 @@ class ResumeShortlistingApp:
                                            key=lambda x: x['overall_score'], 
                                            reverse=True)
                     
-                    st.markdown("**Top 3:**")
-                    for i, rank in enumerate(sorted_rankings[:3], 1):
-                        col1, col2 = st.columns([3, 1])
-                        with col1:
-                            st.write(f"{i}. Candidate #{i}")
-                        with col2:
-                            st.write(f"**{rank['overall_score']:.1f}%**")
-                    
-                    def load_results(job_id, rankings_data):
-                        formatted_rankings = []
-                        for idx, rank in enumerate(rankings_data, 1):
-                            formatted_rankings.append({
-                                'name': f"Candidate #{idx}",
-                                'email': 'N/A',
-                                'phone': 'N/A',
-                                'overall_score': rank['overall_score'],
-                                'skills_score': rank.get('skills_score', 0),
-                                'experience_score': rank.get('experience_score', 0),
-                                'education_score': rank.get('education_score', 0),
-                                'total_experience': 0,
-                                'matched_skills': rank.get('matched_skills', []),
-                                'missing_skills': rank.get('missing_skills', []),
-                                'explanation': rank.get('explanation', {})
-                            })
-                        st.session_state.ranked_candidates = formatted_rankings
+                    # One markdown element per job rather than columns and writes per row
+                    top_three = "\n".join(
+                        f"{i}. Candidate #{i} — **{rank['overall_score']:.1f}%**"
+                        for i, rank in enumerate(sorted_rankings[:3], 1)
+                    )
+                    st.markdown(f"**Top 3:**\n\n{top_three}")
                     
                     if st.button(f"📊 View Full Results", 
                                key=f"view_{job['id']}", 
                                use_container_width=True,
-                               on_click=load_results,
-                               args=(job['id'], sorted_rankings)):
+                               on_click=self.load_stored_rankings,
+                               args=(sorted_rankings,)):
                         st.success("Results loaded! Go to Rankings tab.")
                 else:
                     st.info("No rankings for this job yet.")
@@ -444,8 +838,7 @@ class ResumeShortlistingApp:
         if not self.db_available:
             st.warning("⚠️ Database not available. Search feature requires database connection.")
             st.info("You can view uploaded resumes in the 'Upload Resumes' tab.")
-            if st.button("Go to Upload Resumes"):
-                self.navigate_to('Upload Resumes')
+            st.button("Go to Upload Resumes", on_click=self.navigate_to, args=('Upload Resumes',))
             return
         
         col1, col2 = st.columns([3, 1])
@@ -473,7 +866,7 @@ class ResumeShortlistingApp:
                     st.success(f"Found {len(results)} candidates with '{search_skill}'")
                     
                     for resume in results:
-                        data = resume['parsed_data']
+                        data = _add_skill_summary(resume['parsed_data'])
                         name = data['contact'].get('name', 'Unknown')
                         
                         with st.expander(f"📄 {name}"):
@@ -490,9 +883,7 @@ class ResumeShortlistingApp:
                                 st.write(f"💼 {len(data.get('experience', []))} jobs")
                             
                             st.markdown("**Skills:**")
-                            all_skills = []
-                            for skills in data.get('skills', {}).values():
-                                all_skills.extend(skills)
+                            all_skills = data['_flat_skills']
                             
                             if all_skills:
                                 skills_text = ", ".join(all_skills[:15])
@@ -537,9 +928,9 @@ class ResumeShortlistingApp:
             st.info(f"**Total Resumes:** {len(st.session_state.parsed_resumes)}")
             
             if st.session_state.parsed_resumes:
-                avg_exp = sum(r.get('total_experience_years', 0) 
-                            for r in st.session_state.parsed_resumes) / len(st.session_state.parsed_resumes)
-                st.info(f"**Avg Experience:** {avg_exp:.1f} years")
+                resumes = st.session_state.parsed_resumes
+                aggregates = _resume_aggregates(tuple(resumes), resumes)
+                st.info(f"**Avg Experience:** {aggregates['avg_experience']:.1f} years")
         
         if st.session_state.parsed_resumes:
             st.markdown("---")
@@ -547,53 +938,93 @@ class ResumeShortlistingApp:
             self.display_parsed_resumes()
     
     def parse_uploaded_files(self, uploaded_files):
-        """Parse uploaded resume files"""
+        """Parse uploaded resume files in parallel"""
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        parsed_count = 0
+        parsed = []
+        reused = []
+        last_push = 0.0
+        
+        max_workers = min(8, os.cpu_count() or 1, len(uploaded_files))
         
-        for i, uploaded_file in enumerate(uploaded_files):
-            status_text.text(f"Parsing: {uploaded_file.name}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Hash every upload first (blake2b releases the GIL, so this overlaps)
+            # so files already in the database skip both parsing and the insert
+            hashes = list(executor.map(content_digest, uploaded_files))
+            stored = self.db.get_resumes_by_hashes(hashes) if self.db_available else {}
             
-            try:
-                temp_path = f"temp_{uploaded_file.name}"
-                with open(temp_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
-                
-                resume_data = self.parser.parse_resume(temp_path)
-                resume_data['filename'] = uploaded_file.name
+            # Identical files within one upload are parsed and saved once
+            unique = {}
+            for uploaded_file, content_hash in zip(uploaded_files, hashes):
+                unique.setdefault(content_hash, uploaded_file)
+            total = len(unique)
+            
+            future_to_file = {}
+            for content_hash, uploaded_file in unique.items():
+                if content_hash in stored:
+                    row = stored[content_hash]
+                    resume_data = dict(row['parsed_data'], id=row['id'], filename=uploaded_file.name)
+                    reused.append((content_hash, resume_data))
+                    continue
                 
-                # Save to database if available
-                if self.db_available:
-                    try:
-                        resume_id = self.db.save_resume(uploaded_file.name, resume_data)
-                        resume_data['id'] = resume_id
-                        self.db.log_action('resume_uploaded', {'filename': uploaded_file.name})
-                    except Exception as e:
-                        st.warning(f"Database save failed: {str(e)}")
+                future = executor.submit(_parse_resume_upload, content_hash, uploaded_file)
+                future_to_file[future] = (uploaded_file.name, content_hash)
+            
+            # Results are collected on the script thread; workers never touch session state
+            for done, future in enumerate(as_completed(future_to_file), len(reused) + 1):
+                filename, content_hash = future_to_file[future]
                 
-                st.session_state.parsed_resumes.append(resume_data)
-                parsed_count += 1
+                try:
+                    resume_data = future.result()
+                    resume_data['filename'] = filename
+                    resume_data['content_hash'] = content_hash
+                    parsed.append((content_hash, resume_data))
                 
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+                except Exception as e:
+                    st.error(f"Failed to parse {filename}: {str(e)}")
                 
+                # Each update is a websocket message; push at most every 250 ms
+                now = time.monotonic()
+                if now - last_push > PROGRESS_INTERVAL or done == total:
+                    progress_bar.progress(done / total)
+                    status_text.text(f"Parsed: {filename} ({done}/{total})")
+                    last_push = now
+        
+        # Save to database if available, as one insert for the whole upload
+        if self.db_available and parsed:
+            try:
+                resume_ids = self.db.save_resumes_bulk([data for _, data in parsed])
+                for (_, resume_data), resume_id in zip(parsed, resume_ids):
+                    resume_data['id'] = resume_id
+                self.db.log_action('resume_batch_uploaded', {
+                    'count': len(parsed),
+                    'filenames': [data['filename'] for _, data in parsed]
+                })
             except Exception as e:
-                st.error(f"Failed to parse {uploaded_file.name}: {str(e)}")
-            
-            progress_bar.progress((i + 1) / len(uploaded_files))
+                st.warning(f"Database save failed: {str(e)}")
+        
+        for content_hash, resume_data in reused + parsed:
+            _add_skill_summary(resume_data)
+            st.session_state.parsed_resumes[content_hash] = resume_data
         
         status_text.empty()
         progress_bar.empty()
         
-        st.success(f"✅ Successfully parsed {parsed_count}/{len(uploaded_files)} resumes!")
+        duplicates = len(uploaded_files) - total
+        st.success(
+            f"✅ Successfully parsed {len(reused) + len(parsed)}/{total} resumes!"
+            + (f" ({duplicates} duplicate file(s) skipped)" if duplicates else "")
+        )
         st.rerun()
     
     def display_parsed_resumes(self):
         """Display list of parsed resumes"""
-        for i, resume in enumerate(st.session_state.parsed_resumes):
+        resumes = st.session_state.parsed_resumes
+        start, stop = self.paginate(len(resumes), key="resumes_page")
+        
+        # Resumes are keyed by content hash, so removal never depends on list position
+        for resume_key, resume in islice(resumes.items(), start, stop):
             with st.expander(f"📄 {resume['contact'].get('name', 'Unknown')} - {resume.get('filename', '')}"):
                 col1, col2, col3 = st.columns(3)
                 
@@ -611,20 +1042,33 @@ class ResumeShortlistingApp:
                 
                 with col3:
                     st.markdown("**Skills**")
-                    total_skills = sum(len(v) for v in resume.get('skills', {}).values())
-                    st.write(f"🛠️ {total_skills} skills")
+                    # Resumes added elsewhere (e.g. bulk upload) get their summary on first render
+                    if '_flat_skills' not in resume:
+                        _add_skill_summary(resume)
+                    st.write(f"🛠️ {resume['_total_skills']} skills")
                     
-                    all_skills = []
-                    for skills in resume.get('skills', {}).values():
-                        all_skills.extend(skills)
-                    if all_skills:
-                        st.write(f"Top: {', '.join(all_skills[:3])}")
+                    if resume['_flat_skills']:
+                        st.write(f"Top: {', '.join(resume['_flat_skills'][:3])}")
                 
-                def remove_resume(index):
-                    st.session_state.parsed_resumes.pop(index)
+                def remove_resume(key):
+                    st.session_state.parsed_resumes.pop(key, None)
                 
-                if st.button(f"🗑️ Remove", key=f"remove_{i}", on_click=remove_resume, args=(i,)):
-                    st.rerun()
+                st.button(f"🗑️ Remove", key=f"remove_{resume_key}", on_click=remove_resume, args=(resume_key,))
+    
+    def paginate(self, total, key):
+        """Render a page picker for long lists and return the (start, stop) bounds"""
+        pages = max(1, -(-total // LIST_PAGE_SIZE))
+        page = 1
+        
+        if pages > 1:
+            # Removals can shrink the list below the remembered page
+            if st.session_state.get(key, 1) > pages:
+                st.session_state[key] = pages
+            page = st.number_input("Page", min_value=1, max_value=pages, key=key)
+            st.caption(f"Page {page} of {pages}")
+        
+        start = (page - 1) * LIST_PAGE_SIZE
+        return start, min(start + LIST_PAGE_SIZE, total)
     
     def page_job_description(self):
         """Job description input page"""
@@ -635,11 +1079,13 @@ class ResumeShortlistingApp:
         with col1:
             st.markdown("### Enter Job Requirements")
             
-            job_description = st.text_area(
-                "Paste the complete job description here:",
-                value=st.session_state.job_description,
-                height=400,
-                placeholder="""Example:
+            # Edits are batched until submit, so drafts don't rerun or reparse the page
+            with st.form("jd_form", border=False):
+                job_description = st.text_area(
+                    "Paste the complete job description here:",
+                    value=st.session_state.job_description,
+                    height=400,
+                    placeholder="""Example:
 Senior Python Developer
 
 Requirements:
@@ -654,35 +1100,38 @@ Must Have Skills:
 Nice to Have:
 - Docker, Kubernetes, React
 """,
-                help="Include requirements, skills, experience, and responsibilities"
-            )
-            
-            st.session_state.job_description = job_description
-            
-            col_btn1, col_btn2 = st.columns(2)
+                    help="Include requirements, skills, experience, and responsibilities"
+                )
+                
+                submitted = st.form_submit_button(
+                    "🚀 Match Candidates",
+                    type="primary",
+                    use_container_width=True
+                )
             
             def use_sample():
                 st.session_state.job_description = self.get_sample_job_description()
             
-            with col_btn1:
-                if st.button("✨ Use Sample Job", use_container_width=True, on_click=use_sample):
-                    st.rerun()
+            st.button("✨ Use Sample Job", use_container_width=True, on_click=use_sample)
             
-            with col_btn2:
-                if st.button("🚀 Match Candidates", type="primary", use_container_width=True):
-                    if not st.session_state.parsed_resumes:
-                        st.error("Please upload resumes first!")
-                    elif not job_description.strip():
-                        st.error("Please enter a job description!")
-                    else:
-                        self.match_candidates(job_description)
+            if submitted:
+                st.session_state.job_description = job_description
+                
+                if not st.session_state.parsed_resumes:
+                    st.error("Please upload resumes first!")
+                elif not job_description.strip():
+                    st.error("Please enter a job description!")
+                else:
+                    self.match_candidates(job_description)
         
         with col2:
+            # Analyze the submitted description, not the unsubmitted draft
+            job_description = st.session_state.job_description
             if job_description:
                 st.markdown("### 🔍 Job Analysis")
                 
                 try:
-                    job_data = self.job_parser.parse_job_description(job_description)
+                    job_data = _parse_job(job_description)
                     
                     st.info(f"**Position:** {job_data['title']}")
                     st.info(f"**Min Experience:** {job_data['min_experience']} years")
@@ -703,13 +1152,11 @@ Nice to Have:
         """Match candidates with job description"""
         with st.spinner("🤖 AI is analyzing candidates..."):
             try:
-                ranked = self.ranker.rank_candidates(
-                    st.session_state.parsed_resumes,
-                    job_description
-                )
-                st.session_state.ranked_candidates = ranked
+                resumes = st.session_state.parsed_resumes
+                ranked = _rank_resumes(tuple(resumes), job_description, list(resumes.values()))
+                self.store_rankings(ranked)
                 
-                job_data = self.job_parser.parse_job_description(job_description)
+                job_data = _parse_job(job_description)
                 st.session_state.current_job_title = job_data['title']
                 
                 # Save to database if available
@@ -738,51 +1185,71 @@ Nice to Have:
         
         if not st.session_state.ranked_candidates:
             st.warning("⚠️ No rankings yet! Please match candidates with a job description first.")
-            if st.button("Go to Job Description"):
-                self.navigate_to('Job Description')
+            st.button("Go to Job Description", on_click=self.navigate_to, args=('Job Description',))
             return
         
         self.display_ranking_metrics()
         
         st.markdown("---")
         
+        self.rankings_table_fragment()
+        
+        st.markdown("---")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            self.download_json_report()
+        
+        with col2:
+            self.download_csv_report()
+    
+    @st.fragment
+    def rankings_table_fragment(self):
+        """Rankings filters and table; their widgets rerun only this fragment"""
         col1, col2, col3 = st.columns(3)
         
         with col1:
             min_score = st.slider("Minimum Score", 0, 100, 0, 5)
         
         with col2:
-            sort_by = st.selectbox("Sort By", ["Overall Score", "Skills Score", "Experience Score"])
+            sort_by = st.selectbox("Sort By", list(SORT_FIELDS))
         
         with col3:
             max_candidates = len(st.session_state.ranked_candidates)
             default_count = min(5, max_candidates)
             show_count = st.number_input("Show Top N", 1, max_candidates, default_count)
         
-        filtered = [c for c in st.session_state.ranked_candidates if c['overall_score'] >= min_score]
+        ranked = st.session_state.ranked_candidates
+        df = st.session_state.ranked_df
         
-        if sort_by == "Skills Score":
-            filtered.sort(key=lambda x: x['skills_score'], reverse=True)
-        elif sort_by == "Experience Score":
-            filtered.sort(key=lambda x: x['experience_score'], reverse=True)
-        
-        filtered = filtered[:show_count]
+        # Mask the cached sort order by score in one vectorized step, then keep
+        # the first show_count; only those rows are turned back into dicts
+        order = self.sort_order(sort_by)
+        visible = order[df['overall_score'].to_numpy()[order] >= min_score][:show_count]
+        filtered = [ranked[i] for i in visible]
         
         st.markdown(f"### Showing {len(filtered)} Candidates")
         
-        for i, candidate in enumerate(filtered, 1):
-            self.display_candidate_card(i, candidate)
-        
-        st.markdown("---")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if st.button("📥 Download Report (JSON)", use_container_width=True):
-                self.download_json_report()
-        
-        with col2:
-            if st.button("📊 Download Report (CSV)", use_container_width=True):
-                self.download_csv_report()
+        if filtered:
+            # One table for the list; the detailed card renders only for the selected row
+            summary_df = df.iloc[visible].rename(columns=RANKING_TABLE_COLUMNS)
+            summary_df.insert(0, 'Rank', np.arange(1, len(visible) + 1))
+            
+            event = st.dataframe(
+                summary_df,
+                use_container_width=True,
+                hide_index=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key="rankings_table"
+            )
+            
+            selected_rows = event.selection.rows
+            selected = selected_rows[0] if selected_rows and selected_rows[0] < len(filtered) else 0
+            st.caption("Select a row to view that candidate's details.")
+            self.display_candidate_card(selected + 1, filtered[selected])
+        else:
+            st.info("No candidates match the current filters.")
     
     def display_ranking_metrics(self):
         """Display summary metrics for rankings"""
@@ -790,20 +1257,23 @@ Nice to Have:
         
         candidates = st.session_state.ranked_candidates
         
+        # Vectorized reductions over the score column built by store_rankings
+        scores = st.session_state.ranked_df['overall_score'].to_numpy()
+        
         with col1:
             st.metric("Total Candidates", len(candidates))
         
         with col2:
-            excellent = sum(1 for c in candidates if c['overall_score'] >= 80)
+            excellent = int((scores >= 80).sum())
             st.metric("Excellent Match (80%+)", excellent)
         
         with col3:
-            good = sum(1 for c in candidates if 60 <= c['overall_score'] < 80)
+            good = int(((scores >= 60) & (scores < 80)).sum())
             st.metric("Good Match (60-79%)", good)
         
         with col4:
-            if candidates:
-                avg_score = sum(c['overall_score'] for c in candidates) / len(candidates)
+            if scores.size:
+                avg_score = float(scores.mean())
                 st.metric("Average Score", f"{avg_score:.1f}%")
     
     def display_candidate_card(self, rank, candidate):
@@ -838,45 +1308,33 @@ Nice to Have:
             st.markdown("---")
             st.markdown("### 📊 Score Breakdown")
             
-            scores_df = pd.DataFrame({
-                'Category': ['Skills', 'Experience', 'Education'],
-                'Score': [
-                    candidate['skills_score'],
-                    candidate['experience_score'],
-                    candidate['education_score']
-                ]
-            })
-            
-            fig = px.bar(
-                scores_df,
-                x='Category',
-                y='Score',
-                color='Score',
-                color_continuous_scale='RdYlGn',
-                range_color=[0, 100]
+            fig = _score_breakdown_fig(
+                candidate['skills_score'],
+                candidate['experience_score'],
+                candidate['education_score']
             )
-            fig.update_layout(height=250, showlegend=False)
             st.plotly_chart(fig, use_container_width=True, key=f"score_chart_rank_{rank}")
             
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("### ✅ Matched Skills")
-                if candidate['matched_skills']:
-                    for skill in candidate['matched_skills'][:10]:
-                        st.markdown(f"✓ {skill}")
-                    if len(candidate['matched_skills']) > 10:
-                        st.markdown(f"*+{len(candidate['matched_skills']) - 10} more*")
+                matched = candidate.get('matched_skills') or ()
+                if matched:
+                    # First ten as one markdown block; the rest are only counted
+                    st.markdown("  \n".join(f"✓ {skill}" for skill in matched[:10]))
+                    if len(matched) > 10:
+                        st.markdown(f"*+{len(matched) - 10} more*")
                 else:
                     st.markdown("*No exact skill matches*")
             
             with col2:
                 st.markdown("### ❌ Missing Skills")
-                if candidate['missing_skills']:
-                    for skill in candidate['missing_skills'][:10]:
-                        st.markdown(f"✗ {skill}")
-                    if len(candidate['missing_skills']) > 10:
-                        st.markdown(f"*+{len(candidate['missing_skills']) - 10} more*")
+                missing = candidate.get('missing_skills') or ()
+                if missing:
+                    st.markdown("  \n".join(f"✗ {skill}" for skill in missing[:10]))
+                    if len(missing) > 10:
+                        st.markdown(f"*+{len(missing) - 10} more*")
                 else:
                     st.markdown("*All required skills present*")
             
@@ -908,167 +1366,97 @@ Nice to Have:
         
         if not st.session_state.ranked_candidates:
             st.warning("No data to analyze. Please rank candidates first!")
-            if st.button("Go to Job Description"):
-                self.navigate_to('Job Description')
+            st.button("Go to Job Description", on_click=self.navigate_to, args=('Job Description',))
             return
         
-        candidates = st.session_state.ranked_candidates
+        # The ranking frame built by store_rankings already holds the numeric
+        # columns, so only the skill lists are read from the candidate dicts
+        df = st.session_state.ranked_df
+        scores = df['overall_score'].to_numpy()
+        skills = pd.DataFrame(
+            st.session_state.ranked_candidates,
+            columns=['matched_skills', 'missing_skills']
+        )
         
         st.markdown("### Score Distribution")
         
-        scores = [c['overall_score'] for c in candidates]
-        fig = go.Figure(data=[go.Histogram(x=scores, nbinsx=10, marker_color='#667eea')])
-        fig.update_layout(
-            title="Candidate Score Distribution",
-            xaxis_title="Overall Score",
-            yaxis_title="Number of Candidates",
-            height=350
-        )
+        fig = _score_histogram_fig(scores)
         st.plotly_chart(fig, use_container_width=True, key="score_distribution")
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("### Most Common Skills")
-            all_matched_skills = []
-            for c in candidates:
-                all_matched_skills.extend(c.get('matched_skills', []))
+            skills_count = _top_skills(skills['matched_skills'])
             
-            if all_matched_skills:
-                skills_count = pd.Series(all_matched_skills).value_counts().head(10)
-                fig = px.bar(
-                    x=skills_count.values,
-                    y=skills_count.index,
-                    orientation='h',
-                    labels={'x': 'Count', 'y': 'Skill'}
-                )
-                fig.update_layout(height=400)
+            if skills_count:
+                fig = _skills_bar_fig(skills_count)
                 st.plotly_chart(fig, use_container_width=True, key="common_skills")
             else:
                 st.info("No matched skills data available")
         
         with col2:
             st.markdown("### Most Missing Skills")
-            all_missing_skills = []
-            for c in candidates:
-                all_missing_skills.extend(c.get('missing_skills', []))
+            missing_count = _top_skills(skills['missing_skills'])
             
-            if all_missing_skills:
-                missing_count = pd.Series(all_missing_skills).value_counts().head(10)
-                fig = px.bar(
-                    x=missing_count.values,
-                    y=missing_count.index,
-                    orientation='h',
-                    labels={'x': 'Count', 'y': 'Skill'},
-                    color_discrete_sequence=['#ef4444']
-                )
-                fig.update_layout(height=400)
+            if missing_count:
+                fig = _skills_bar_fig(missing_count, color='#ef4444')
                 st.plotly_chart(fig, use_container_width=True, key="missing_skills")
             else:
                 st.info("No missing skills data available")
         
         st.markdown("### Experience vs Match Score")
         
-        exp_data = pd.DataFrame({
-            'Experience': [c.get('total_experience', 0) for c in candidates],
-            'Score': [c['overall_score'] for c in candidates],
-            'Name': [c['name'] for c in candidates]
+        exp_data = df[['total_experience', 'overall_score', 'name']].rename(columns={
+            'total_experience': 'Experience',
+            'overall_score': 'Score',
+            'name': 'Name'
         })
         
-        fig = px.scatter(
-            exp_data,
-            x='Experience',
-            y='Score',
-            hover_data=['Name'],
-            size=[10]*len(exp_data),
-            color='Score',
-            color_continuous_scale='RdYlGn'
-        )
-        fig.update_layout(height=400)
+        fig = _experience_scatter_fig(exp_data)
         st.plotly_chart(fig, use_container_width=True, key="exp_vs_score")
     
     def download_json_report(self):
-        """Generate JSON report for download"""
-        report_data = {
-            'generated_at': datetime.now().isoformat(),
-            'total_candidates': len(st.session_state.ranked_candidates),
-            'candidates': st.session_state.ranked_candidates
-        }
-        
-        json_str = json.dumps(report_data, indent=2)
+        """Render JSON report download button"""
+        json_bytes = _build_json_report(
+            st.session_state.rankings_key,
+            st.session_state.ranked_at,
+            st.session_state.ranked_candidates
+        )
         st.download_button(
-            label="📥 Download JSON",
-            data=json_str,
-            file_name=f"ranking_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            mime="application/json"
+            label="📥 Download Report (JSON)",
+            data=json_bytes,
+            file_name=_report_file_name('json'),
+            mime="application/json",
+            use_container_width=True
         )
     
     def download_csv_report(self):
-        """Generate CSV report for download"""
-        candidates = st.session_state.ranked_candidates
-        
-        csv_data = []
-        for c in candidates:
-            csv_data.append({
-                'Name': c['name'],
-                'Email': c['email'],
-                'Phone': c['phone'],
-                'Overall Score': c['overall_score'],
-                'Skills Score': c['skills_score'],
-                'Experience Score': c['experience_score'],
-                'Education Score': c['education_score'],
-                'Total Experience': c.get('total_experience', 0),
-                'Matched Skills': ', '.join(c.get('matched_skills', [])[:5]),
-                'Missing Skills': ', '.join(c.get('missing_skills', [])[:5])
-            })
-        
-        df = pd.DataFrame(csv_data)
-        csv = df.to_csv(index=False)
-        
+        """Render CSV report download button"""
+        csv = _build_csv_report(
+            st.session_state.rankings_key,
+            st.session_state.ranked_candidates
+        )
         st.download_button(
-            label="📊 Download CSV",
+            label="📊 Download Report (CSV)",
             data=csv,
-            file_name=f"ranking_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
+            file_name=_report_file_name('csv'),
+            mime="text/csv",
+            use_container_width=True
         )
     
     def get_sample_job_description(self):
         """Return sample job description"""
-        return """Senior Python Developer
+        return _SAMPLE_JD
 
-We are seeking an experienced Python Developer to join our AI/ML team.
 
-Requirements:
-- 3-5 years of professional Python development experience
-- Strong experience with Machine Learning frameworks (TensorFlow, PyTorch)
-- Experience with cloud platforms (AWS preferred)
-- Bachelor's degree in Computer Science or related field
-
-Must Have Skills:
-- Python (expert level)
-- Machine Learning & Deep Learning
-- TensorFlow or PyTorch
-- SQL databases (MySQL, PostgreSQL)
-- REST API development
-- Git version control
-
-Nice to Have:
-- AWS/Azure/GCP experience
-- Docker and Kubernetes
-- React or frontend experience
-- Experience with NLP projects
-- CI/CD pipelines
-
-Responsibilities:
-- Develop and deploy machine learning models
-- Build scalable ML pipelines
-- Collaborate with data scientists and engineers
-- Write clean, maintainable, well-documented code
-- Participate in code reviews
-"""
+@st.cache_resource
+def _get_app():
+    """Shared application instance, built once per process"""
+    return ResumeShortlistingApp()
 
 
 # Main application entry point
 if __name__ == "__main__":
-    app = ResumeShortlistingApp()
+    app = _get_app()
     app.run()
@@ -5,16 +5,21 @@ Beautiful, interactive dashboard for resume screening and ranking
 
 import streamlit as st
 import pandas as pd
-import json
+import numpy as np
+import io
+import orjson
 import os
 from pathlib import Path
 import plotly.graph_objects as go
 import plotly.express as px
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from operator import itemgetter
 
 # Import your backend logic
 from resume_parser import ResumeParser
 from job_resume_matcher import CandidateRanker, JobDescriptionParser
+from content_hash import blake2b_128
 
 
 # -------------------- PAGE CONFIGURATION --------------------
@@ -52,19 +57,75 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Rankings sort options other than "Overall" (already the ranker's order)
+SORT_FIELDS = {"Skills": "skills_score", "Experience": "experience_score"}
+TABLE_COLUMNS = ["name", "email", "overall_score", "skills_score", "experience_score"]
+_overall_score = itemgetter("overall_score")
+
+
+# -------------------- SHARED RESOURCES --------------------
+# Built once per process and shared by every session; treat them as read-only
+@st.cache_resource
+def _get_parser():
+    return ResumeParser()
+
+
+@st.cache_resource
+def _get_ranker():
+    return CandidateRanker()
+
+
+@st.cache_resource
+def _get_job_parser():
+    return JobDescriptionParser()
+
+
+# -------------------- CACHED PARSING --------------------
+@st.cache_data(show_spinner=False, max_entries=256, ttl="1h")
+def _parse_resume_bytes(name: str, data: bytes) -> dict:
+    """Parse an uploaded resume once per (filename, content); reruns hit the cache."""
+    return _get_parser().parse_resume_stream(io.BytesIO(data), name)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _parse_jd(text: str) -> dict:
+    """Parse a job description once per distinct text, not on every rerun."""
+    return _get_job_parser().parse_job_description(text)
+
+
+@st.cache_data(show_spinner="Matching...", max_entries=32)
+def _rank(resumes_key: str, jd: str, _resumes: list, _ranker) -> list:
+    """Rank once per (resumes, JD); the resumes are keyed by a digest of their JSON."""
+    return _ranker.rank_candidates(_resumes, jd)
+
+
+def _resumes_digest(resumes: list) -> str:
+    """128-bit BLAKE2b digest of the canonical JSON of the parsed resumes."""
+    canonical = orjson.dumps(
+        resumes, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+    return blake2b_128(canonical).hexdigest()
+
+
+def _score_array(cands) -> np.ndarray:
+    """Overall scores as a float array, read with one lookup per candidate."""
+    return np.fromiter(map(_overall_score, cands), dtype=float, count=len(cands))
+
+
 # -------------------- MAIN APPLICATION --------------------
 class ResumeShortlistingApp:
     """Main application class for AI Resume Shortlisting"""
 
     def __init__(self):
-        self.parser = ResumeParser()
-        self.ranker = CandidateRanker()
-        self.job_parser = JobDescriptionParser()
+        self.parser = _get_parser()
+        self.ranker = _get_ranker()
+        self.job_parser = _get_job_parser()
 
         # Initialize session state
         for key, default in {
             "parsed_resumes": [],
             "ranked_candidates": [],
+            "excellent_count": None,
             "job_description": "",
             "current_page": "Upload Resumes",
         }.items():
@@ -110,15 +171,13 @@ class ResumeShortlistingApp:
             st.header("📊 Statistics")
             st.metric("Resumes Uploaded", len(st.session_state.parsed_resumes))
             if st.session_state.ranked_candidates:
-                excellent = sum(
-                    1 for c in st.session_state.ranked_candidates if c["overall_score"] >= 80
-                )
-                st.metric("Excellent Matches", excellent)
+                st.metric("Excellent Matches", st.session_state.excellent_count)
 
             st.markdown("---")
             if st.button("🗑️ Clear All Data", use_container_width=True):
                 for key in ["parsed_resumes", "ranked_candidates", "job_description"]:
                     st.session_state[key] = []
+                st.session_state.excellent_count = None
                 st.success("All data cleared successfully!")
                 st.rerun()
 
@@ -158,23 +217,27 @@ class ResumeShortlistingApp:
         progress = st.progress(0)
         status = st.empty()
         parsed_count = 0
-
-        for i, file in enumerate(uploaded_files):
-            status.text(f"Parsing: {file.name}")
-            try:
-                temp_path = f"temp_{file.name}"
-                with open(temp_path, "wb") as f:
-                    f.write(file.getbuffer())
-
-                data = self.parser.parse_resume(temp_path)
-                data["filename"] = file.name
-                st.session_state.parsed_resumes.append(data)
-                parsed_count += 1
-                os.remove(temp_path)
-            except Exception as e:
-                st.error(f"❌ Failed to parse {file.name}: {e}")
-
-            progress.progress(int((i + 1) / len(uploaded_files) * 100))
+        total = len(uploaded_files)
+
+        # Text extraction is I/O-heavy, so files are parsed on a thread pool;
+        # results are gathered here because workers must not touch session state
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, total)) as ex:
+            futures = {
+                ex.submit(_parse_resume_bytes, f.name, f.getvalue()): f.name
+                for f in uploaded_files
+            }
+            for i, fut in enumerate(as_completed(futures), 1):
+                name = futures[fut]
+                status.text(f"Parsed: {name}")
+                try:
+                    data = fut.result()
+                    data["filename"] = name
+                    st.session_state.parsed_resumes.append(data)
+                    parsed_count += 1
+                except Exception as e:
+                    st.error(f"❌ Failed to parse {name}: {e}")
+
+                progress.progress(int(i / total * 100))
 
         status.empty()
         progress.empty()
@@ -237,7 +300,7 @@ class ResumeShortlistingApp:
         with col2:
             if job_desc.strip():
                 st.subheader("🔍 Job Analysis")
-                job_data = self.job_parser.parse_job_description(job_desc)
+                job_data = _parse_jd(job_desc)
                 st.info(f"**Position:** {job_data['title']}")
                 st.info(f"**Min Experience:** {job_data['min_experience']} years")
 
@@ -245,10 +308,11 @@ class ResumeShortlistingApp:
     def match_candidates(self, job_description):
         with st.spinner("🤖 Matching candidates..."):
             try:
-                ranked = self.ranker.rank_candidates(
-                    st.session_state.parsed_resumes, job_description
-                )
+                resumes = st.session_state.parsed_resumes
+                ranked = _rank(_resumes_digest(resumes), job_description, resumes, self.ranker)
                 st.session_state.ranked_candidates = ranked
+                # Counted once here; the sidebar reads it on every rerun
+                st.session_state.excellent_count = int((_score_array(ranked) >= 80).sum())
                 st.success(f"✅ Ranked {len(ranked)} candidates!")
                 st.session_state["current_page"] = "Rankings"
                 st.rerun()
@@ -264,38 +328,63 @@ class ResumeShortlistingApp:
 
         self.display_ranking_metrics()
         st.markdown("---")
+        self._render_filtered(st.session_state.ranked_candidates)
 
-        candidates = st.session_state.ranked_candidates
+    @st.fragment
+    def _render_filtered(self, candidates):
+        # Filter widgets rerun only this fragment, not the sidebar and metrics
         min_score = st.slider("Minimum Score", 0, 100, 0)
         sort_by = st.selectbox("Sort By", ["Overall", "Skills", "Experience"])
         show_count = st.number_input(
             "Show Top N", min_value=1, max_value=len(candidates), value=min(10, len(candidates))
         )
+        view = st.radio("View", ["Cards", "Table"], horizontal=True)
+
+        all_scores = _score_array(candidates)
+        filtered = [candidates[i] for i in np.flatnonzero(all_scores >= min_score)]
+        if sort_by in SORT_FIELDS:
+            # Sort keys gathered once; a stable argsort replaces the per-item lambda
+            field = SORT_FIELDS[sort_by]
+            keys = np.fromiter((c[field] for c in filtered), dtype=float, count=len(filtered))
+            order = np.argsort(-keys, kind="stable")[:show_count]
+            filtered = [filtered[i] for i in order]
+        else:
+            filtered = filtered[:show_count]
+
+        if view == "Table":
+            # One dataframe element instead of an expander per candidate
+            df = pd.DataFrame.from_records(filtered, columns=TABLE_COLUMNS)
+            score_col = st.column_config.ProgressColumn(
+                "Overall Score", format="%.1f%%", min_value=0, max_value=100
+            )
+            st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={"overall_score": score_col},
+            )
+            return
 
-        filtered = [c for c in candidates if c["overall_score"] >= min_score]
-        if sort_by == "Skills":
-            filtered.sort(key=lambda x: x["skills_score"], reverse=True)
-        elif sort_by == "Experience":
-            filtered.sort(key=lambda x: x["experience_score"], reverse=True)
-        filtered = filtered[:show_count]
-
-        for i, c in enumerate(filtered, 1):
-            self.display_candidate_card(i, c)
+        # Classify every visible score at once instead of branching per card
+        scores = _score_array(filtered)
+        classes = np.select(
+            [scores >= 80, scores >= 60], ["score-excellent", "score-good"], default="score-moderate"
+        )
+        for i, (c, color_class) in enumerate(zip(filtered, classes), 1):
+            self.display_candidate_card(i, c, color_class)
 
     def display_ranking_metrics(self):
         cands = st.session_state.ranked_candidates
+        # One pass to build the array, then vectorized reductions
+        scores = _score_array(cands)
         col1, col2, col3, col4 = st.columns(4)
         col1.metric("Total Candidates", len(cands))
-        col2.metric("Excellent (80%+)", sum(1 for c in cands if c["overall_score"] >= 80))
-        col3.metric("Good (60–79%)", sum(1 for c in cands if 60 <= c["overall_score"] < 80))
-        avg = sum(c["overall_score"] for c in cands) / len(cands)
-        col4.metric("Avg Score", f"{avg:.1f}%")
+        col2.metric("Excellent (80%+)", int((scores >= 80).sum()))
+        col3.metric("Good (60–79%)", int(((scores >= 60) & (scores < 80)).sum()))
+        col4.metric("Avg Score", f"{float(scores.mean()):.1f}%")
 
-    def display_candidate_card(self, rank, c):
+    def display_candidate_card(self, rank, c, color_class):
         score = c["overall_score"]
-        color_class = (
-            "score-excellent" if score >= 80 else "score-good" if score >= 60 else "score-moderate"
-        )
         with st.expander(f"#{rank}: {c['name']} – {score:.1f}%", expanded=rank <= 3):
             st.markdown(f"<h3 class='{color_class}'>{score:.1f}% Match</h3>", unsafe_allow_html=True)
             st.write(f"**Email:** {c['email']}")
@@ -309,7 +398,7 @@ class ResumeShortlistingApp:
             return
 
         cands = st.session_state.ranked_candidates
-        scores = [c["overall_score"] for c in cands]
+        scores = _score_array(cands)
         fig = go.Figure(data=[go.Histogram(x=scores, nbinsx=10, marker_color="#667eea")])
         fig.update_layout(title="Score Distribution", height=350)
         st.plotly_chart(fig, use_container_width=True)
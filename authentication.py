@@ -4,28 +4,76 @@ User login, signup, and session management with Name field
 """
 
 import streamlit as st
-from supabase import create_client, Client
-from datetime import datetime
+import hmac
 import re
+from functools import wraps
+from typing import TYPE_CHECKING, Optional
+
+# supabase pulls in httpx, gotrue, postgrest and more; import it only when a
+# client is actually created
+if TYPE_CHECKING:
+    from supabase import Client
+
+# \Z rather than $ so a trailing newline is not accepted
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+
+# gotrue error code, and message on releases without codes, for a rejected
+# email/password pair. invalid_grant is not enough: gotrue also uses it for
+# cases such as an unconfirmed email
+INVALID_LOGIN_CODE = 'invalid_credentials'
+INVALID_LOGIN_MESSAGE = 'invalid login credentials'
+
+# Static login page banner and footer
+_AUTH_HEADER_HTML = """
+<div style='text-align: center; padding: 20px;'>
+    <h1>🎯 AI Resume Shortlisting</h1>
+    <p style='color: #666;'>Sign in to access your recruitment dashboard</p>
+</div>
+"""
+
+_AUTH_FOOTER_HTML = """
+<div style='text-align: center; color: #666; font-size: 12px;'>
+    <p>Powered by AI & Machine Learning</p>
+    <p>© 2024 Resume Shortlisting System</p>
+</div>
+"""
+
+
+def _create_supabase() -> Optional["Client"]:
+    """New Supabase client, or None if not configured"""
+    # Secrets are read here rather than at import, so a missing secrets file
+    # still only disables auth instead of breaking the app import
+    url = st.secrets.get("SUPABASE_URL", "")
+    key = st.secrets.get("SUPABASE_KEY", "")
+    if not (url and key):
+        return None
+    
+    from supabase import create_client
+    return create_client(url, key)
+
+
+@st.cache_resource
+def _get_supabase() -> Optional["Client"]:
+    """Supabase client shared by the process for calls that keep no session"""
+    return _create_supabase()
+
 
 class AuthManager:
     """Handle user authentication with Supabase"""
     
     def __init__(self):
-        # Get Supabase credentials
-        self.url = st.secrets.get("SUPABASE_URL", "")
-        self.key = st.secrets.get("SUPABASE_KEY", "")
-        
-        if self.url and self.key:
-            self.client: Client = create_client(self.url, self.key)
-        else:
-            self.client = None
+        # Shared client for sign-up and password reset only; gotrue stores the
+        # signed-in session on its client, so stateful calls use _session_client
+        self.client: Optional["Client"] = _get_supabase()
+    
+    def _session_client(self) -> Optional["Client"]:
+        """Client owned by this browser session, created on first use"""
+        if not self.client:
+            return None
         
-        # Initialize session state
-        if 'user' not in st.session_state:
-            st.session_state.user = None
-        if 'access_token' not in st.session_state:
-            st.session_state.access_token = None
+        if st.session_state.get('auth_client') is None:
+            st.session_state.auth_client = _create_supabase()
+        return st.session_state.auth_client
     
     def is_authenticated(self) -> bool:
         """Check if user is authenticated"""
@@ -40,6 +88,8 @@ class AuthManager:
         if not self.client:
             return False, "Authentication not configured"
         
+        from gotrue.errors import AuthApiError
+        
         try:
             # SECURITY: Only allow specific email(s) to signup
             ALLOWED_EMAILS = [
@@ -76,20 +126,26 @@ class AuthManager:
             else:
                 return False, "Failed to create account"
         
-        except Exception as e:
-            error_msg = str(e)
-            if "already registered" in error_msg.lower():
+        except AuthApiError as e:
+            # Newer gotrue releases carry an error code; older ones only the message
+            code = getattr(e, 'code', None)
+            if code == 'user_already_exists' or (code is None and "already registered" in e.message):
                 return False, "Email already registered"
-            return False, f"Signup failed: {error_msg}"
+            return False, f"Signup failed: {e.message}"
+        
+        except Exception as e:
+            return False, f"Signup failed: {str(e)}"
     
     def sign_in(self, email: str, password: str) -> tuple:
         """Login user"""
         if not self.client:
             return False, "Authentication not configured"
         
+        from gotrue.errors import AuthApiError
+        
         try:
-            # Sign in with Supabase Auth
-            response = self.client.auth.sign_in_with_password({
+            # Sign in with Supabase Auth on this session's own client
+            response = self._session_client().auth.sign_in_with_password({
                 "email": email,
                 "password": password
             })
@@ -102,31 +158,42 @@ class AuthManager:
                     'full_name': response.user.user_metadata.get('full_name', ''),
                     'created_at': response.user.created_at
                 }
+                # SECURITY: never compare this token with ==; use tokens_match
                 st.session_state.access_token = response.session.access_token
                 
                 return True, f"Welcome back, {st.session_state.user['full_name']}!"
             else:
                 return False, "Invalid credentials"
         
-        except Exception as e:
-            error_msg = str(e)
-            if "invalid" in error_msg.lower():
+        except AuthApiError as e:
+            # Releases without error codes are classified by message
+            code = getattr(e, 'code', None)
+            if code == INVALID_LOGIN_CODE or (code is None and INVALID_LOGIN_MESSAGE in e.message.lower()):
                 return False, "Invalid email or password"
-            return False, f"Login failed: {error_msg}"
+            return False, f"Login failed: {e.message}"
+        
+        except Exception as e:
+            return False, f"Login failed: {str(e)}"
     
     def sign_out(self):
         """Logout user"""
-        if self.client:
+        # Only revoke remotely when this session holds a signed-in client
+        client = st.session_state.get('auth_client')
+        if client is not None and st.session_state.get('access_token') is not None:
             try:
-                self.client.auth.sign_out()
-            except:
+                client.auth.sign_out()
+            except Exception:
                 pass
         
         # Clear session
+        st.session_state.auth_client = None
         st.session_state.user = None
         st.session_state.access_token = None
-        st.session_state.parsed_resumes = []
+        st.session_state.parsed_resumes = {}
         st.session_state.ranked_candidates = []
+        st.session_state.ranked_df = None
+        st.session_state.sort_indices = {}
+        st.session_state.excellent_count = None
     
     def reset_password(self, email: str) -> tuple:
         """Send password reset email"""
@@ -148,7 +215,7 @@ class AuthManager:
             if not full_name or full_name.strip() == "":
                 return False, "Name cannot be empty"
             
-            self.client.auth.update_user({
+            self._session_client().auth.update_user({
                 "data": {
                     "full_name": full_name.strip()
                 }
@@ -159,22 +226,57 @@ class AuthManager:
         except Exception as e:
             return False, f"Update failed: {str(e)}"
     
-    def _validate_email(self, email: str) -> bool:
+    @staticmethod
+    def tokens_match(expected: str, provided: str) -> bool:
+        """Constant-time comparison for access tokens and other secrets"""
+        if not expected or not provided:
+            return False
+        return hmac.compare_digest(expected.encode(), provided.encode())
+    
+    @staticmethod
+    def _validate_email(email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return EMAIL_PATTERN.match(email) is not None
     
-    def _validate_password(self, password: str) -> bool:
+    @staticmethod
+    def _validate_password(password: str) -> bool:
         """Validate password strength"""
-        return (len(password) >= 8 and 
-                any(c.isalpha() for c in password) and 
-                any(c.isdigit() for c in password))
+        if len(password) < 8:
+            return False
+        
+        # One pass that stops as soon as both a letter and a digit are seen
+        has_alpha = has_digit = False
+        for c in password:
+            if not has_alpha and c.isalpha():
+                has_alpha = True
+            elif not has_digit and c.isdigit():
+                has_digit = True
+            if has_alpha and has_digit:
+                return True
+        
+        return False
+
+
+@st.cache_resource
+def _shared_auth_manager():
+    """AuthManager built once per process so the Supabase client is reused"""
+    # Safe to share: the manager holds only the stateless client, and every
+    # per-user session lives in st.session_state
+    return AuthManager()
+
+
+def get_auth_manager() -> AuthManager:
+    """Shared AuthManager with this session's auth state initialized"""
+    for key in ('user', 'access_token', 'auth_client'):
+        st.session_state.setdefault(key, None)
+    
+    return _shared_auth_manager()
 
 
 def render_auth_page():
     """Render authentication page (login/signup)"""
     
-    auth_manager = AuthManager()
+    auth_manager = get_auth_manager()
     
     # Check if already authenticated
     if auth_manager.is_authenticated():
@@ -185,12 +287,7 @@ def render_auth_page():
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col2:
-        st.markdown("""
-        <div style='text-align: center; padding: 20px;'>
-            <h1>🎯 AI Resume Shortlisting</h1>
-            <p style='color: #666;'>Sign in to access your recruitment dashboard</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_AUTH_HEADER_HTML, unsafe_allow_html=True)
         
         # Tabs for login/signup
         tab1, tab2 = st.tabs(["🔐 Login", "📝 Sign Up"])
@@ -315,18 +412,16 @@ def render_auth_page():
         
         # Footer
         st.markdown("---")
-        st.markdown("""
-        <div style='text-align: center; color: #666; font-size: 12px;'>
-            <p>Powered by AI & Machine Learning</p>
-            <p>© 2024 Resume Shortlisting System</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_AUTH_FOOTER_HTML, unsafe_allow_html=True)
 
 
 def render_profile_page(auth_manager: AuthManager):
     """Render user profile page"""
     
-    user = auth_manager.get_current_user()
+    user = auth_manager.get_current_user() or {}
+    full_name = user.get('full_name', '')
+    email = user.get('email', '')
+    member_since = (user.get('created_at') or '')[:10] or 'N/A'
     
     st.header("👤 User Profile")
     
@@ -339,20 +434,20 @@ def render_profile_page(auth_manager: AuthManager):
         with st.form("profile_form"):
             full_name = st.text_input(
                 "Full Name",
-                value=user.get('full_name', ''),
+                value=full_name,
                 key="profile_name"
             )
             
             st.text_input(
                 "Email",
-                value=user.get('email', ''),
+                value=email,
                 disabled=True,
                 help="Email cannot be changed"
             )
             
             st.text_input(
                 "Member Since",
-                value=user.get('created_at', '')[:10] if user.get('created_at') else 'N/A',
+                value=member_since,
                 disabled=True
             )
             
@@ -388,17 +483,19 @@ def render_profile_page(auth_manager: AuthManager):
     with col2:
         st.markdown("### Quick Stats")
         
-        # Get user stats from database if available
-        st.metric("Resumes Processed", len(st.session_state.get('parsed_resumes', [])))
-        st.metric("Jobs Analyzed", len(st.session_state.get('ranked_candidates', [])) > 0)
+        # Session stats; the current ranking counts as one analyzed job
+        parsed = st.session_state.get('parsed_resumes') or ()
+        ranked = st.session_state.get('ranked_candidates') or ()
+        st.metric("Resumes Processed", len(parsed))
+        st.metric("Jobs Analyzed", 1 if ranked else 0)
 
 
 def require_auth(func):
     """Decorator to require authentication for a page"""
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        auth_manager = AuthManager()
-        
-        if not auth_manager.is_authenticated():
+        # Checked straight from session state; no manager is needed for this
+        if st.session_state.get('user') is None:
             st.warning("⚠️ Please login to access this feature")
             
             col1, col2, col3 = st.columns([1, 1, 1])
@@ -418,7 +515,7 @@ def require_auth(func):
 def render_auth_sidebar():
     """Render auth status in sidebar"""
     
-    auth_manager = AuthManager()
+    auth_manager = get_auth_manager()
     
     with st.sidebar:
         st.markdown("---")
@@ -4,14 +4,77 @@ Upload and process multiple resumes from ZIP files
 """
 
 import zipfile
-import os
-import tempfile
+import csv
 import streamlit as st
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
+import importlib
 import io
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, islice
 import time
+from content_hash import blake2b_128
+
+# Columns of the bulk upload CSV report
+BULK_CSV_COLUMNS = [
+    'Filename', 'Name', 'Email', 'Phone', 'Experience (years)',
+    'Num Jobs', 'Num Education', 'Total Skills', 'Top 3 Skills'
+]
+
+
+def _parse_file(parser, filename: str, data: bytes) -> Dict:
+    """Parse one in-memory resume into a result dict tagged with its status"""
+    try:
+        resume_data = parser.parse_resume_stream(io.BytesIO(data), filename)
+        resume_data['filename'] = filename
+        resume_data['content_hash'] = blake2b_128(data).hexdigest()
+        # Counted once in the worker; the result tabs and CSV report reuse it
+        resume_data['total_skills'] = sum(len(v) for v in resume_data.get('skills', {}).values())
+        resume_data['status'] = 'success'
+        return resume_data
+    except Exception as e:
+        return {
+            'filename': filename,
+            'status': 'failed',
+            'error': str(e)
+        }
+
+
+# Parser owned by a bulk worker process, built once by _init_worker
+_worker_parser = None
+
+
+def _init_worker(parser_path: str):
+    """Build this worker's parser (models load once per process, not per file)"""
+    global _worker_parser
+    module_name, class_name = parser_path.rsplit('.', 1)
+    _worker_parser = getattr(importlib.import_module(module_name), class_name)()
+
+
+def _parse_in_worker(filename: str, data: bytes) -> Dict:
+    """Parse a resume with the worker process's own parser"""
+    return _parse_file(_worker_parser, filename, data)
+
+
+@st.cache_resource
+def _worker_pool(parser_path: str) -> ProcessPoolExecutor:
+    """Process pool kept across bulk runs, so workers keep their loaded models"""
+    # Parsing is CPU-bound Python, so workers are processes rather than
+    # threads; spawn avoids forking the multi-threaded Streamlit server.
+    # One pool per parser, sized to the machine; runs limit their own
+    # concurrency by how many tasks they keep in flight
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 4,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(parser_path,)
+    )
+
 
 class BulkResumeProcessor:
     """Handle bulk resume uploads and processing"""
@@ -20,57 +83,80 @@ class BulkResumeProcessor:
         self.parser = parser
         self.supported_formats = ['.pdf', '.docx', '.doc']
         self.max_file_size = 10 * 1024 * 1024  # 10MB per file
-    
-    def extract_zip(self, zip_file) -> List[Path]:
-        """Extract resume files from ZIP"""
-        extracted_files = []
-        
+        self.max_total_size = 500 * 1024 * 1024  # 500MB uncompressed per ZIP
+    
+    def resume_members(self, zip_ref: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+        """Resume entries of a ZIP, chosen from its directory alone"""
+        # Format and size are checked before anything is decompressed
+        return [
+            member for member in zip_ref.infolist()
+            if not member.is_dir()
+            and Path(member.filename).suffix.lower() in self.supported_formats
+            and member.file_size <= self.max_file_size
+        ]
+    
+    def extract_zip(self, zip_file, max_workers: int = 4) -> List[Tuple[str, bytes]]:
+        """Read resume files from ZIP into memory as (filename, bytes) pairs"""
         try:
-            # Create temporary directory
-            temp_dir = tempfile.mkdtemp()
+            data = zip_file.getvalue() if hasattr(zip_file, 'getvalue') else zip_file.read()
             
-            # Extract ZIP
-            with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
+            with zipfile.ZipFile(io.BytesIO(data), 'r') as zip_ref:
+                members = self.resume_members(zip_ref)
             
-            # Find all resume files
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    
-                    # Check if supported format
-                    if file_path.suffix.lower() in self.supported_formats:
-                        # Check file size
-                        if file_path.stat().st_size <= self.max_file_size:
-                            extracted_files.append(file_path)
+            # Entries are held in memory, so cap the archive's inflated total
+            # before reading any of them (guards against ZIP bombs)
+            total_size = sum(member.file_size for member in members)
+            if total_size > self.max_total_size:
+                st.error(
+                    f"ZIP expands to {total_size / 1024 / 1024:.0f}MB of resumes; "
+                    f"the limit is {self.max_total_size / 1024 / 1024:.0f}MB"
+                )
+                return []
+            
+            # A ZipFile handle is not safe to share across threads, so each
+            # worker opens its own over the same bytes
+            local = threading.local()
+            handles = []
+            
+            def read_entry(member):
+                zip_ref = getattr(local, 'zip_ref', None)
+                if zip_ref is None:
+                    zip_ref = local.zip_ref = zipfile.ZipFile(io.BytesIO(data), 'r')
+                    handles.append(zip_ref)
+                return Path(member.filename).name, zip_ref.read(member)
             
-            return extracted_files, temp_dir
+            try:
+                # Entries inflate independently and zlib releases the GIL
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    return list(executor.map(read_entry, members))
+            finally:
+                for zip_ref in handles:
+                    zip_ref.close()
         
         except Exception as e:
             st.error(f"Failed to extract ZIP: {str(e)}")
-            return [], None
+            return []
     
-    def parse_single_resume(self, file_path: Path) -> Dict:
+    def parse_single_resume(self, item: Tuple[str, bytes]) -> Dict:
         """Parse a single resume"""
-        try:
-            resume_data = self.parser.parse_resume(str(file_path))
-            resume_data['filename'] = file_path.name
-            resume_data['status'] = 'success'
-            return resume_data
-        except Exception as e:
-            return {
-                'filename': file_path.name,
-                'status': 'failed',
-                'error': str(e)
-            }
-    
-    def parse_bulk_resumes(self, file_paths: List[Path], 
+        return _parse_file(self.parser, *item)
+    
+    @staticmethod
+    def _fill(executor, pending: deque, in_flight: Dict, max_workers: int):
+        """Submit queued entries until max_workers futures are in flight"""
+        while pending and len(in_flight) < max_workers:
+            filename, data = pending[0]
+            in_flight[executor.submit(_parse_in_worker, filename, data)] = filename
+            # Dequeued only once submitted, so a broken pool loses no entry
+            pending.popleft()
+    
+    def parse_bulk_resumes(self, entries: List[Tuple[str, bytes]], 
                           max_workers: int = 4) -> Dict:
         """Parse multiple resumes in parallel"""
         results = {
             'successful': [],
             'failed': [],
-            'total': len(file_paths),
+            'total': len(entries),
             'success_count': 0,
             'fail_count': 0
         }
@@ -79,19 +165,31 @@ class BulkResumeProcessor:
         progress_bar = st.progress(0)
         status_text = st.empty()
         
+        # No more tasks in flight than there are resumes
+        max_workers = max(1, min(max_workers, len(entries)))
+        
         processed = 0
+        pending = deque(entries)
+        in_flight = {}
+        
+        # Start this run's tasks on the shared pool; if a worker died since the
+        # last run the pool is broken, so it is shut down and replaced once
+        parser_path = f"{type(self.parser).__module__}.{type(self.parser).__qualname__}"
+        executor = _worker_pool(parser_path)
+        try:
+            self._fill(executor, pending, in_flight, max_workers)
+        except BrokenProcessPool:
+            executor.shutdown(wait=False, cancel_futures=True)
+            _worker_pool.clear()
+            executor = _worker_pool(parser_path)
+            self._fill(executor, pending, in_flight, max_workers)
         
-        # Use ThreadPoolExecutor for parallel processing
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(self.parse_single_resume, fp): fp 
-                for fp in file_paths
-            }
+        # Process completed tasks, topping the pool back up as each one finishes
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
             
-            # Process completed tasks
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
+            for future in done:
+                filename = in_flight.pop(future)
                 processed += 1
                 
                 try:
@@ -111,24 +209,29 @@ class BulkResumeProcessor:
                 
                 except Exception as e:
                     results['failed'].append({
-                        'filename': file_path.name,
+                        'filename': filename,
+                        'status': 'failed',
+                        'error': str(e)
+                    })
+                    results['fail_count'] += 1
+            
+            try:
+                self._fill(executor, pending, in_flight, max_workers)
+            except BrokenProcessPool as e:
+                # The pool died mid-run; the next run replaces it
+                for filename, _ in pending:
+                    results['failed'].append({
+                        'filename': filename,
                         'status': 'failed',
                         'error': str(e)
                     })
                     results['fail_count'] += 1
+                pending.clear()
         
         progress_bar.empty()
         status_text.empty()
         
         return results
-    
-    def cleanup_temp_files(self, temp_dir: str):
-        """Clean up temporary extracted files"""
-        try:
-            import shutil
-            shutil.rmtree(temp_dir)
-        except:
-            pass
 
 
 def render_bulk_upload_ui(parser, db_manager=None):
@@ -156,16 +259,20 @@ def render_bulk_upload_ui(parser, db_manager=None):
         file_size_mb = uploaded_zip.size / (1024 * 1024)
         st.info(f"📁 **File:** {uploaded_zip.name} ({file_size_mb:.2f} MB)")
         
+        # Default to one worker per core; more workers than cores only adds
+        # contention, and small ZIPs are clamped in parse_bulk_resumes
+        cpu_count = os.cpu_count() or 4
+        
         # Processing options
         col1, col2 = st.columns(2)
         
         with col1:
             max_workers = st.slider(
-                "Parallel Processing Threads",
+                "Parallel Worker Processes",
                 min_value=1,
-                max_value=8,
-                value=4,
-                help="More threads = faster processing (uses more CPU)"
+                max_value=max(2, cpu_count),
+                value=cpu_count,
+                help="One process per CPU core is usually fastest"
             )
         
         with col2:
@@ -187,27 +294,27 @@ def process_bulk_resumes(uploaded_zip, parser, db_manager, max_workers, save_to_
     processor = BulkResumeProcessor(parser)
     
     with st.spinner("Extracting ZIP file..."):
-        file_paths, temp_dir = processor.extract_zip(uploaded_zip)
+        entries = processor.extract_zip(uploaded_zip, max_workers)
     
-    if not file_paths:
+    if not entries:
         st.error("No valid resume files found in ZIP!")
         return
     
-    st.success(f"✅ Found {len(file_paths)} resume file(s)")
+    st.success(f"✅ Found {len(entries)} resume file(s)")
     
     # Show file list
-    with st.expander(f"📄 Files to process ({len(file_paths)})"):
-        for fp in file_paths[:20]:  # Show first 20
-            st.write(f"• {fp.name}")
-        if len(file_paths) > 20:
-            st.write(f"... and {len(file_paths) - 20} more")
+    with st.expander(f"📄 Files to process ({len(entries)})"):
+        for filename, _ in entries[:20]:  # Show first 20
+            st.write(f"• {filename}")
+        if len(entries) > 20:
+            st.write(f"... and {len(entries) - 20} more")
     
     # Parse resumes
     st.markdown("---")
     st.markdown("### 🔄 Processing Resumes...")
     
     start_time = time.time()
-    results = processor.parse_bulk_resumes(file_paths, max_workers)
+    results = processor.parse_bulk_resumes(entries, max_workers)
     processing_time = time.time() - start_time
     
     # Show results
@@ -233,22 +340,21 @@ def process_bulk_resumes(uploaded_zip, parser, db_manager, max_workers, save_to_
     # Save to database if enabled
     if save_to_db and db_manager and results['successful']:
         with st.spinner("Saving to database..."):
-            saved_count = 0
-            for resume_data in results['successful']:
-                try:
-                    db_manager.save_resume(resume_data['filename'], resume_data)
-                    saved_count += 1
-                except Exception as e:
-                    st.warning(f"Failed to save {resume_data['filename']}: {e}")
+            # One insert for the whole batch instead of a round trip per resume
+            saved_ids = db_manager.save_resumes_bulk(results['successful'])
             
-            st.success(f"💾 Saved {saved_count} resumes to database!")
+            if saved_ids:
+                st.success(f"💾 Saved {len(saved_ids)} resumes to database!")
     
     # Add to session state
     if results['successful']:
         if 'parsed_resumes' not in st.session_state:
-            st.session_state.parsed_resumes = []
+            st.session_state.parsed_resumes = {}
         
-        st.session_state.parsed_resumes.extend(results['successful'])
+        # Session resumes are keyed by content hash (duplicates collapse)
+        st.session_state.parsed_resumes.update(
+            (resume['content_hash'], resume) for resume in results['successful']
+        )
         st.success(f"✅ Added {len(results['successful'])} resumes to current session!")
     
     # Show detailed results
@@ -271,8 +377,7 @@ def process_bulk_resumes(uploaded_zip, parser, db_manager, max_workers, save_to_
                         st.write(f"**Jobs:** {len(resume.get('experience', []))}")
                     
                     with col_c:
-                        total_skills = sum(len(v) for v in resume.get('skills', {}).values())
-                        st.write(f"**Skills:** {total_skills}")
+                        st.write(f"**Skills:** {resume['total_skills']}")
                         st.write(f"**Education:** {len(resume.get('education', []))}")
             
             if len(results['successful']) > 10:
@@ -303,9 +408,7 @@ def process_bulk_resumes(uploaded_zip, parser, db_manager, max_workers, save_to_
     with tab3:
         st.markdown("### Processing Summary")
         
-        # Create summary DataFrame
-        import pandas as pd
-        
+        # Summary table; st.dataframe takes the column dict directly
         summary_data = {
             'Metric': [
                 'Total Files',
@@ -325,7 +428,7 @@ def process_bulk_resumes(uploaded_zip, parser, db_manager, max_workers, save_to_
             ]
         }
         
-        st.dataframe(pd.DataFrame(summary_data), use_container_width=True, hide_index=True)
+        st.dataframe(summary_data, use_container_width=True, hide_index=True)
         
         # Experience distribution
         if results['successful']:
@@ -383,33 +486,31 @@ def process_bulk_resumes(uploaded_zip, parser, db_manager, max_workers, save_to_
                     mime="text/plain"
                 )
     
-    # Cleanup
-    processor.cleanup_temp_files(temp_dir)
-    
     st.success("🎉 Bulk processing complete!")
 
 
+def _resume_csv_row(resume: Dict) -> tuple:
+    """One bulk report row for a parsed resume"""
+    contact = resume['contact']
+    skills = resume.get('skills', {})
+    return (
+        resume.get('filename', 'N/A'),
+        contact.get('name', 'N/A'),
+        contact.get('email', 'N/A'),
+        contact.get('phone', 'N/A'),
+        resume.get('total_experience_years', 0),
+        len(resume.get('experience', [])),
+        len(resume.get('education', [])),
+        resume['total_skills'],
+        # Only the first three skills are taken; the full list is never flattened
+        ', '.join(islice(chain.from_iterable(skills.values()), 3))
+    )
+
+
 def create_csv_report(resumes: List[Dict]) -> str:
     """Create CSV report from parsed resumes"""
-    import pandas as pd
-    import io
-    
-    data = []
-    for resume in resumes:
-        data.append({
-            'Filename': resume.get('filename', 'N/A'),
-            'Name': resume['contact'].get('name', 'N/A'),
-            'Email': resume['contact'].get('email', 'N/A'),
-            'Phone': resume['contact'].get('phone', 'N/A'),
-            'Experience (years)': resume.get('total_experience_years', 0),
-            'Num Jobs': len(resume.get('experience', [])),
-            'Num Education': len(resume.get('education', [])),
-            'Total Skills': sum(len(v) for v in resume.get('skills', {}).values()),
-            'Top 3 Skills': ', '.join([
-                skill for skills in resume.get('skills', {}).values() 
-                for skill in skills
-            ][:3])
-        })
-    
-    df = pd.DataFrame(data)
-    return df.to_csv(index=False)
\ No newline at end of file
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(BULK_CSV_COLUMNS)
+    writer.writerows(_resume_csv_row(resume) for resume in resumes)
+    return buffer.getvalue()
@@ -0,0 +1,29 @@
+"""
+Content Hashing
+BLAKE2b digests used to key parsed resumes and cached rankings
+"""
+
+import hashlib
+from functools import partial
+
+
+def blake2b_128(data=b''):
+    """128-bit BLAKE2b, the content hash used to key parsed resumes"""
+    return hashlib.blake2b(data, digest_size=16)
+
+
+def content_digest(fileobj) -> str:
+    """Hash a binary file object without materializing its contents"""
+    if hasattr(fileobj, 'getbuffer'):
+        # In-memory uploads are hashed straight from their buffer (no copy)
+        with fileobj.getbuffer() as buffer:
+            return blake2b_128(buffer).hexdigest()
+    
+    if hasattr(hashlib, 'file_digest'):
+        return hashlib.file_digest(fileobj, blake2b_128).hexdigest()
+    
+    # Python < 3.11: stream 1 MiB chunks
+    digest = blake2b_128()
+    for chunk in iter(partial(fileobj.read, 1 << 20), b''):
+        digest.update(chunk)
+    return digest.hexdigest()
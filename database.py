@@ -5,8 +5,39 @@ Handles all database operations with proper error handling
 
 import streamlit as st
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
+from postgrest.exceptions import APIError
 from datetime import datetime
-import json
+from itertools import chain
+import orjson
+
+# Seconds before a PostgREST call gives up, so a stalled connection cannot
+# hang a rerun; keep-alive pooling comes from the client's own httpx session
+POSTGREST_TIMEOUT = 10
+
+# Rows per bulk insert request
+INSERT_BATCH_SIZE = 500
+
+# Seconds a cached full-table read is reused across reruns
+READ_CACHE_TTL = 60
+
+# PostgREST and Postgres codes for a SQL function that does not exist
+MISSING_FUNCTION_CODES = frozenset({'PGRST202', '42883'})
+
+# Postgres code for ON CONFLICT without a matching unique constraint
+NO_UNIQUE_CONSTRAINT_CODE = '42P10'
+
+
+def _to_jsonb(value):
+    """Plain JSON types for a JSONB column (numpy values and dates included)"""
+    return orjson.loads(orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY))
+
+
+@st.cache_data(ttl=READ_CACHE_TTL, show_spinner=False)
+def _fetch_all_resumes(_client):
+    """All resume rows; errors propagate so failures are never cached"""
+    response = _client.table('resumes').select('*').execute()
+    return response.data if response.data else []
 
 
 class SupabaseManager:
@@ -17,12 +48,25 @@ class SupabaseManager:
         try:
             url = st.secrets["SUPABASE_URL"]
             key = st.secrets["SUPABASE_KEY"]
-            self.client: Client = create_client(url, key)
+            options = ClientOptions(postgrest_client_timeout=POSTGREST_TIMEOUT)
+            self.client: Client = create_client(url, key, options=options)
+            self.skill_rpc_available = True
+            self.summary_rpc_available = True
+            self.ranking_upsert_available = True
+            # Callables run after every successful write, e.g. to clear the
+            # app's cached reads
+            self.write_hooks = []
         except KeyError as e:
             raise ValueError(f"Missing Supabase configuration: {e}")
         except Exception as e:
             raise ValueError(f"Failed to connect to Supabase: {e}")
     
+    def _after_write(self):
+        """Drop cached reads after a successful write"""
+        _fetch_all_resumes.clear()
+        for hook in self.write_hooks:
+            hook()
+    
     # ==================== RESUME OPERATIONS ====================
     
     def save_resume(self, filename, parsed_data):
@@ -39,13 +83,14 @@ class SupabaseManager:
         try:
             data = {
                 'filename': filename,
-                'parsed_data': parsed_data,
+                'parsed_data': _to_jsonb(parsed_data),
                 'upload_date': datetime.now().isoformat()
             }
             
             response = self.client.table('resumes').insert(data).execute()
             
             if response.data:
+                self._after_write()
                 return response.data[0]['id']
             else:
                 raise Exception("No data returned from insert")
@@ -54,47 +99,178 @@ class SupabaseManager:
             st.error(f"Failed to save resume: {str(e)}")
             return None
     
+    def save_resumes_bulk(self, parsed_resumes):
+        """
+        Save several parsed resumes, one insert per INSERT_BATCH_SIZE rows
+        
+        Args:
+            parsed_resumes: List of parsed resume dictionaries (each with 'filename')
+        
+        Returns:
+            list: Resume IDs in the same order as parsed_resumes; if a batch
+            fails, the IDs of the batches already saved
+        """
+        if not parsed_resumes:
+            return []
+        
+        ids = []
+        try:
+            upload_date = datetime.now().isoformat()
+            data = [
+                {
+                    'filename': parsed_data['filename'],
+                    'parsed_data': _to_jsonb(parsed_data),
+                    'upload_date': upload_date
+                }
+                for parsed_data in parsed_resumes
+            ]
+            
+            # Batches keep each request under PostgREST's payload limit
+            for start in range(0, len(data), INSERT_BATCH_SIZE):
+                batch = data[start:start + INSERT_BATCH_SIZE]
+                response = self.client.table('resumes').insert(batch).execute()
+                
+                if not response.data:
+                    raise Exception("No data returned from insert")
+                ids.extend(row['id'] for row in response.data)
+            
+            self._after_write()
+            return ids
+                
+        except Exception as e:
+            if not ids:
+                st.error(f"Failed to save resumes: {str(e)}")
+                return []
+            
+            # Earlier batches are already committed, so report them as saved
+            self._after_write()
+            st.error(f"Saved {len(ids)} of {len(parsed_resumes)} resumes; the rest failed: {str(e)}")
+            return ids
+    
+    def get_resumes_by_hashes(self, content_hashes):
+        """
+        Look up previously saved resumes by file content hash
+        
+        Args:
+            content_hashes: Content hashes of the files being uploaded
+        
+        Returns:
+            dict: Content hash -> saved resume row (id, filename, parsed_data)
+        """
+        if not content_hashes:
+            return {}
+        
+        try:
+            response = (
+                self.client.table('resumes')
+                .select('id, filename, parsed_data')
+                .in_('parsed_data->>content_hash', list(set(content_hashes)))
+                .execute()
+            )
+            
+            return {
+                row['parsed_data']['content_hash']: row
+                for row in response.data or []
+            }
+            
+        except Exception as e:
+            st.warning(f"Could not check for existing resumes: {str(e)}")
+            return {}
+    
     def get_all_resumes(self):
         """Get all resumes from database"""
         try:
-            response = self.client.table('resumes').select('*').execute()
-            return response.data if response.data else []
+            return _fetch_all_resumes(self.client)
         except Exception as e:
             st.warning(f"Could not fetch resumes: {str(e)}")
             return []
     
-    def search_candidates_by_skill(self, skill):
+    def search_candidates_by_skill(self, skill, limit=50):
         """
         Search candidates by skill
         
+        Matching runs in Postgres through the search_by_skill function, which
+        returns only the rows with a skill containing the term (literally, as
+        in the fallback below, so % and _ are not wildcards):
+            CREATE OR REPLACE FUNCTION public.search_by_skill(q text, max_rows int)
+            RETURNS TABLE (id bigint, filename text, parsed_data jsonb) AS $$
+                SELECT r.id, r.filename, r.parsed_data FROM public.resumes r
+                WHERE EXISTS (
+                    SELECT 1 FROM jsonb_each(r.parsed_data->'skills') e,
+                        jsonb_array_elements_text(e.value) s
+                    WHERE jsonb_typeof(e.value) = 'array' AND strpos(lower(s), lower(q)) > 0
+                )
+                LIMIT max_rows;
+            $$ LANGUAGE sql STABLE;
+        
+        Without that function, the skills JSON is prefiltered with ILIKE (which
+        a trigram index can serve) and individual skills are checked here:
+            CREATE EXTENSION IF NOT EXISTS pg_trgm;
+            CREATE INDEX IF NOT EXISTS resumes_skills_trgm_idx ON public.resumes
+                USING gin ((parsed_data->>'skills') gin_trgm_ops);
+        
         Args:
             skill: Skill to search for
+            limit: Maximum number of matching resumes returned
         
         Returns:
             list: Matching resumes
         """
+        if self.skill_rpc_available:
+            try:
+                response = self.client.rpc(
+                    'search_by_skill', {'q': skill, 'max_rows': limit}
+                ).execute()
+                return response.data or []
+            except APIError as e:
+                # Function not installed; use the prefilter path from now on
+                if e.code in MISSING_FUNCTION_CODES:
+                    self.skill_rpc_available = False
+            except Exception:
+                # Timeouts and other transient errors fall back for this call only
+                pass
+        
+        # Escape LIKE wildcards so the term is matched literally
+        escaped = skill.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        needle = skill.lower()
+        results = []
+        
         try:
-            # Search in parsed_data JSONB field
-            response = self.client.table('resumes').select('*').execute()
-            
-            # Filter results by skill (case-insensitive)
-            results = []
-            for resume in response.data:
-                parsed_data = resume.get('parsed_data', {})
-                
-                # Search in skills dictionary
-                skills_dict = parsed_data.get('skills', {})
-                all_skills = []
+            # Search in parsed_data JSONB field; only rows whose skills text
+            # contains the term leave the database. The prefilter also hits
+            # category names, so pages are read until limit rows really match
+            offset = 0
+            while len(results) < limit:
+                response = (
+                    self.client.table('resumes')
+                    .select('id, filename, parsed_data')
+                    .ilike('parsed_data->>skills', f'%{escaped}%')
+                    .order('id')
+                    .range(offset, offset + limit - 1)
+                    .execute()
+                )
+                rows = response.data or []
                 
-                for skill_list in skills_dict.values():
-                    if isinstance(skill_list, list):
-                        all_skills.extend(skill_list)
+                # Match individual skills (case-insensitive)
+                for resume in rows:
+                    parsed_data = resume.get('parsed_data', {})
+                    
+                    # Search in skills dictionary
+                    skills_dict = parsed_data.get('skills', {})
+                    all_skills = chain.from_iterable(
+                        skill_list for skill_list in skills_dict.values()
+                        if isinstance(skill_list, list)
+                    )
+                    
+                    # Check if skill matches
+                    if any(needle in s.lower() for s in all_skills):
+                        results.append(resume)
                 
-                # Check if skill matches
-                if any(skill.lower() in s.lower() for s in all_skills):
-                    results.append(resume)
+                if len(rows) < limit:
+                    break
+                offset += limit
             
-            return results
+            return results[:limit]
             
         except Exception as e:
             st.warning(f"Search failed: {str(e)}")
@@ -129,6 +305,7 @@ class SupabaseManager:
             response = self.client.table('job_postings').insert(data).execute()
             
             if response.data:
+                self._after_write()
                 return response.data[0]['id']
             else:
                 raise Exception("No data returned from insert")
@@ -187,6 +364,13 @@ class SupabaseManager:
         """
         Save candidate rankings to database
         
+        Rows are upserted on (job_posting_id, ranking_position), so a job's
+        previous rankings never disappear mid-save. This needs:
+            ALTER TABLE public.rankings ADD CONSTRAINT rankings_job_position
+                UNIQUE (job_posting_id, ranking_position);
+        Position is used rather than candidate email, which can be empty or
+        repeated within one ranking.
+        
         Args:
             job_id: Job posting ID
             rankings: List of ranked candidates
@@ -196,6 +380,7 @@ class SupabaseManager:
         """
         try:
             records = []
+            created_at = datetime.now().isoformat()
             
             for i, candidate in enumerate(rankings, 1):
                 record = {
@@ -212,16 +397,39 @@ class SupabaseManager:
                     'missing_skills': candidate.get('missing_skills', []),
                     'total_experience': float(candidate.get('total_experience', 0)),
                     'explanation': candidate.get('explanation', {}),
-                    'created_at': datetime.now().isoformat()  # Changed from 'ranked_at' to 'created_at'
+                    'created_at': created_at  # Changed from 'ranked_at' to 'created_at'
                 }
                 records.append(record)
             
+            if self.ranking_upsert_available:
+                try:
+                    if records:
+                        self.client.table('rankings').upsert(
+                            records, on_conflict='job_posting_id,ranking_position'
+                        ).execute()
+                except APIError as e:
+                    # No unique constraint yet; replace the rows instead from now on.
+                    # Any other error is reported below
+                    if e.code != NO_UNIQUE_CONSTRAINT_CODE:
+                        raise
+                    self.ranking_upsert_available = False
+                else:
+                    # Drop positions left over from a longer previous ranking; if
+                    # this fails the upsert is kept and the error reported
+                    self.client.table('rankings').delete().eq(
+                        'job_posting_id', job_id
+                    ).gt('ranking_position', len(records)).execute()
+                    self._after_write()
+                    return True
+            
             # Delete old rankings for this job
             self.client.table('rankings').delete().eq('job_posting_id', job_id).execute()
             
-            # Insert new rankings
-            response = self.client.table('rankings').insert(records).execute()
+            # Insert new rankings in a single request
+            if records:
+                self.client.table('rankings').insert(records).execute()
             
+            self._after_write()
             return True
             
         except Exception as e:
@@ -250,18 +458,53 @@ class SupabaseManager:
     
     # ==================== ANALYTICS ====================
     
+    def _count_rows(self, table_name):
+        """Exact row count of a table, read from the response's Content-Range"""
+        # postgrest-py as pinned by supabase 1.0.3 has no head=True, so the
+        # response carries a single id instead of no rows
+        response = self.client.table(table_name).select('id', count='exact').limit(1).execute()
+        return response.count or 0
+    
     def get_analytics_summary(self):
         """
         Get summary analytics
         
+        All four numbers come from one call to the analytics_summary function:
+            CREATE OR REPLACE FUNCTION public.analytics_summary()
+            RETURNS TABLE (total_resumes bigint, total_jobs bigint,
+                           total_rankings bigint, avg_score numeric) AS $$
+                SELECT (SELECT count(*) FROM public.resumes),
+                       (SELECT count(*) FROM public.job_postings),
+                       (SELECT count(*) FROM public.rankings),
+                       (SELECT coalesce(avg(overall_score), 0) FROM public.rankings);
+            $$ LANGUAGE sql STABLE;
+        Without it, the counts and scores are fetched with separate queries.
+        
         Returns:
             dict: Analytics data
         """
+        if self.summary_rpc_available:
+            try:
+                row = self.client.rpc('analytics_summary', {}).execute().data[0]
+                return {
+                    'total_resumes': row['total_resumes'] or 0,
+                    'total_jobs': row['total_jobs'] or 0,
+                    'total_rankings': row['total_rankings'] or 0,
+                    'avg_score': round(float(row['avg_score'] or 0), 2)
+                }
+            except APIError as e:
+                # Function not installed; use the per-table queries from now on
+                if e.code in MISSING_FUNCTION_CODES:
+                    self.summary_rpc_available = False
+            except Exception:
+                # Timeouts, network errors and empty results fall back for this call only
+                pass
+        
         try:
             # Get counts
-            resumes_response = self.client.table('resumes').select('id', count='exact').execute()
-            jobs_response = self.client.table('job_postings').select('id', count='exact').execute()
-            rankings_response = self.client.table('rankings').select('id', count='exact').execute()
+            total_resumes = self._count_rows('resumes')
+            total_jobs = self._count_rows('job_postings')
+            total_rankings = self._count_rows('rankings')
             
             # Get average score
             rankings_data = self.client.table('rankings').select('overall_score').execute()
@@ -272,9 +515,9 @@ class SupabaseManager:
                 avg_score = sum(scores) / len(scores) if scores else 0
             
             return {
-                'total_resumes': resumes_response.count if resumes_response.count else 0,
-                'total_jobs': jobs_response.count if jobs_response.count else 0,
-                'total_rankings': rankings_response.count if rankings_response.count else 0,
+                'total_resumes': total_resumes,
+                'total_jobs': total_jobs,
+                'total_rankings': total_rankings,
                 'avg_score': round(avg_score, 2)
             }
             
@@ -4,9 +4,13 @@ Intelligently matches resumes with job descriptions and ranks candidates
 """
 
 import json
+import os
 import re
+from concurrent.futures import Executor
+from functools import partial
 from typing import Dict, List, Tuple
 import numpy as np
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import spacy
@@ -432,8 +436,8 @@ class JobResumeMatcher:
             if not resume_text or not job_text:
                 return 50.0
             
-            # Calculate TF-IDF similarity
-            vectors = self.vectorizer.fit_transform([job_text, resume_text])
+            # Calculate TF-IDF similarity (fit a clone so a shared matcher stays stateless)
+            vectors = clone(self.vectorizer).fit_transform([job_text, resume_text])
             similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
             
             # Convert to percentage
@@ -513,6 +517,31 @@ class JobResumeMatcher:
         return explanation
 
 
+# Minimum shard size before ranking is spread across processes
+MIN_RESUMES_PER_WORKER = 4
+
+
+# Ranker owned by a ranking worker process, built once by init_rank_worker
+_worker_ranker = None
+
+
+def init_rank_worker():
+    """Build this worker's ranker (models load once per process, not per shard)"""
+    global _worker_ranker
+    _worker_ranker = CandidateRanker()
+
+
+def _rank_chunk(start: int, resumes: List[Dict], job_description: str) -> List[Dict]:
+    """Rank one shard of resumes (runs inside a worker process)"""
+    ranked = _worker_ranker.rank_candidates(resumes, job_description)
+    
+    # Send back each resume's global index rather than pickling it again
+    positions = {id(resume): start + i for i, resume in enumerate(resumes)}
+    for candidate in ranked:
+        candidate['resume_data'] = positions[id(candidate['resume_data'])]
+    return ranked
+
+
 class CandidateRanker:
     """Rank and shortlist candidates based on match scores"""
     
@@ -573,6 +602,46 @@ class CandidateRanker:
         
         return ranked_candidates
     
+    def rank_candidates_parallel(
+        self, 
+        resumes: List[Dict], 
+        job_description: str,
+        executor: Executor,
+        max_workers: int = None
+    ) -> List[Dict]:
+        """
+        Rank candidates across worker processes
+        
+        Args:
+            resumes: List of parsed resume dictionaries
+            job_description: Raw job description text
+            executor: Long-lived process pool whose workers ran init_rank_worker
+            max_workers: Number of shards (None for CPU count)
+            
+        Returns:
+            List of ranked candidates with scores, in the same order as
+            rank_candidates
+        """
+        workers = max_workers or os.cpu_count() or 1
+        
+        # Pickling shards outweighs the gain for small batches
+        if workers < 2 or len(resumes) < workers * MIN_RESUMES_PER_WORKER:
+            return self.rank_candidates(resumes, job_description)
+        
+        chunk_size = -(-len(resumes) // workers)
+        starts = range(0, len(resumes), chunk_size)
+        chunks = [resumes[i:i + chunk_size] for i in starts]
+        results = executor.map(partial(_rank_chunk, job_description=job_description), starts, chunks)
+        
+        # Merge shards in input order, so the stable sort breaks score ties
+        # exactly as the serial ranking does, and reattach the resumes
+        ranked_candidates = [candidate for chunk in results for candidate in chunk]
+        for candidate in ranked_candidates:
+            candidate['resume_data'] = resumes[candidate['resume_data']]
+        ranked_candidates.sort(key=lambda x: x['overall_score'], reverse=True)
+        
+        return ranked_candidates
+    
     def generate_report(
         self, 
         ranked_candidates: List[Dict],
@@ -9,7 +9,7 @@ import PyPDF2
 import docx
 import spacy
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 import pandas as pd
 from pathlib import Path
 import phonenumbers
@@ -104,41 +104,59 @@ class ResumeParser:
             Dictionary containing structured resume data
         """
         file_path = Path(file_path)
+        return self._parse_source(file_path, file_path.name)
+    
+    def parse_resume_stream(self, stream: BinaryIO, file_name: str) -> Dict:
+        """
+        Parse resume from an in-memory file object, without touching disk
+        
+        Args:
+            stream: Binary file-like object (e.g. BytesIO or an uploaded file)
+            file_name: Original file name; its extension selects the reader
+            
+        Returns:
+            Dictionary containing structured resume data
+        """
+        stream.seek(0)
+        return self._parse_source(stream, Path(file_name).name)
+    
+    def _parse_source(self, source: Union[Path, BinaryIO], file_name: str) -> Dict:
+        """Extract and parse text from a path or binary stream"""
+        suffix = Path(file_name).suffix.lower()
         
         # Extract text based on file type
-        if file_path.suffix.lower() == '.pdf':
-            text = self._extract_text_from_pdf(file_path)
-        elif file_path.suffix.lower() in ['.docx', '.doc']:
-            text = self._extract_text_from_docx(file_path)
+        if suffix == '.pdf':
+            text = self._extract_text_from_pdf(source)
+        elif suffix in ['.docx', '.doc']:
+            text = self._extract_text_from_docx(source)
         else:
-            raise ValueError(f"Unsupported file format: {file_path.suffix}")
+            raise ValueError(f"Unsupported file format: {Path(file_name).suffix}")
         
         # Parse the extracted text
         parsed_data = self._parse_text(text)
-        parsed_data['file_name'] = file_path.name
+        parsed_data['file_name'] = file_name
         parsed_data['parsed_date'] = datetime.now().isoformat()
         
         return parsed_data
     
-    def _extract_text_from_pdf(self, file_path: Path) -> str:
-        """Extract text from PDF file"""
+    def _extract_text_from_pdf(self, source: Union[Path, BinaryIO]) -> str:
+        """Extract text from PDF file or stream"""
         text = ""
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+            pdf_reader = PyPDF2.PdfReader(source)
+            for page in pdf_reader.pages:
+                text += page.extract_text() + "\n"
         except Exception as e:
             print(f"Error reading PDF: {e}")
             raise
         
         return text
     
-    def _extract_text_from_docx(self, file_path: Path) -> str:
-        """Extract text from DOCX file"""
+    def _extract_text_from_docx(self, source: Union[Path, BinaryIO]) -> str:
+        """Extract text from DOCX file or stream"""
         text = ""
         try:
-            doc = docx.Document(file_path)
+            doc = docx.Document(source)
             for paragraph in doc.paragraphs:
                 text += paragraph.text + "\n"
         except Exception as e:
@@ -0,0 +1,58 @@
+"""
+Test script for Authentication
+Checks the credential validators (no Supabase needed)
+"""
+
+from authentication import AuthManager, EMAIL_PATTERN
+
+
+def test_validate_password():
+    """At least 8 characters with both a letter and a digit"""
+    assert AuthManager._validate_password("abcdefg1")
+    assert AuthManager._validate_password("1234567a")
+    assert AuthManager._validate_password("Pa55 word!")
+    
+    assert not AuthManager._validate_password("abc1")         # too short
+    assert not AuthManager._validate_password("abcdefgh")     # no digit
+    assert not AuthManager._validate_password("12345678")     # no letter
+    assert not AuthManager._validate_password("!@#$%^&*()")   # neither
+    assert not AuthManager._validate_password("")
+
+
+def test_validate_email():
+    """Plain addresses pass; malformed ones and trailing newlines do not"""
+    assert AuthManager._validate_email("recruiter@company.com")
+    assert AuthManager._validate_email("first.last+jobs@mail.example.co.in")
+    
+    assert not AuthManager._validate_email("recruiter@company")
+    assert not AuthManager._validate_email("recruiter.company.com")
+    assert not AuthManager._validate_email("@company.com")
+    assert not AuthManager._validate_email("recruiter@company.com\n")
+    assert EMAIL_PATTERN.match("a b@company.com") is None
+
+
+def test_tokens_match():
+    """Equal tokens match; empty or different ones never do"""
+    assert AuthManager.tokens_match("token-123", "token-123")
+    
+    assert not AuthManager.tokens_match("token-123", "token-124")
+    assert not AuthManager.tokens_match("token-123", "")
+    assert not AuthManager.tokens_match(None, None)
+
+
+def main():
+    tests = [
+        test_validate_password,
+        test_validate_email,
+        test_tokens_match,
+    ]
+    
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    
+    print(f"\n✅ All {len(tests)} authentication checks passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Test script for Bulk Resume Upload
+Checks ZIP extraction and in-memory parsing without a real resume
+"""
+
+import io
+import zipfile
+from bulk_upload import BulkResumeProcessor, _parse_file, _worker_pool
+from content_hash import blake2b_128
+
+
+class FakeParser:
+    """Stands in for ResumeParser; fails on files named bad*"""
+    
+    def parse_resume_stream(self, stream, file_name):
+        if file_name.startswith('bad'):
+            raise ValueError("unreadable resume")
+        return {
+            'contact': {'name': stream.read().decode()},
+            'skills': {'programming': ['Python', 'SQL'], 'soft_skills': ['Teamwork']}
+        }
+
+
+def make_zip(entries):
+    """In-memory ZIP built from (name, bytes) pairs"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+        for name, data in entries:
+            zip_ref.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+def test_extract_zip_reads_resumes():
+    """Only supported formats come back, as (base filename, bytes) pairs"""
+    processor = BulkResumeProcessor(FakeParser())
+    zip_file = make_zip([
+        ('cv/alice.pdf', b'alice'),
+        ('bob.docx', b'bob'),
+        ('notes.txt', b'skip me'),
+    ])
+    
+    entries = sorted(processor.extract_zip(zip_file))
+    assert entries == [('alice.pdf', b'alice'), ('bob.docx', b'bob')]
+
+
+def test_extract_zip_skips_oversized_files():
+    """Entries over the per-file limit are dropped before they are inflated"""
+    processor = BulkResumeProcessor(FakeParser())
+    processor.max_file_size = 10
+    zip_file = make_zip([('small.pdf', b'x' * 10), ('large.pdf', b'x' * 11)])
+    
+    assert processor.extract_zip(zip_file) == [('small.pdf', b'x' * 10)]
+
+
+def test_extract_zip_total_size_cap():
+    """A ZIP whose resumes inflate past max_total_size yields nothing"""
+    processor = BulkResumeProcessor(FakeParser())
+    processor.max_total_size = 1000
+    
+    # Highly compressible, like a ZIP bomb: tiny on disk, over the cap inflated
+    over_cap = make_zip([('a.pdf', b'\0' * 600), ('b.pdf', b'\0' * 600)])
+    assert processor.extract_zip(over_cap) == []
+    
+    at_cap = make_zip([('a.pdf', b'\0' * 500), ('b.pdf', b'\0' * 500)])
+    assert len(processor.extract_zip(at_cap)) == 2
+
+
+def test_parse_file_success():
+    """A parsed resume is tagged with its filename, content hash and skill count"""
+    result = _parse_file(FakeParser(), 'alice.pdf', b'alice')
+    
+    assert result['status'] == 'success'
+    assert result['filename'] == 'alice.pdf'
+    assert result['contact']['name'] == 'alice'
+    assert result['content_hash'] == blake2b_128(b'alice').hexdigest()
+    assert result['total_skills'] == 3
+
+
+def test_parse_file_failure():
+    """Parser errors are returned as a failed result instead of raised"""
+    result = _parse_file(FakeParser(), 'bad.pdf', b'')
+    
+    assert result == {
+        'filename': 'bad.pdf',
+        'status': 'failed',
+        'error': 'unreadable resume'
+    }
+
+
+def test_parse_bulk_resumes():
+    """Resumes parsed on the shared worker pool are split into successes and failures"""
+    processor = BulkResumeProcessor(FakeParser())
+    entries = [(f'resume{i}.pdf', f'candidate {i}'.encode()) for i in range(5)]
+    entries.append(('bad.pdf', b''))
+    
+    results = processor.parse_bulk_resumes(entries, max_workers=2)
+    
+    assert results['total'] == 6
+    assert results['success_count'] == 5
+    assert results['fail_count'] == 1
+    assert sorted(r['filename'] for r in results['successful']) == [e[0] for e in entries[:5]]
+    assert results['failed'][0]['filename'] == 'bad.pdf'
+    
+    # A second run with another worker count reuses the same pool
+    pool = _worker_pool(f"{FakeParser.__module__}.{FakeParser.__qualname__}")
+    again = processor.parse_bulk_resumes(entries[:2], max_workers=1)
+    assert again['success_count'] == 2
+    assert _worker_pool(f"{FakeParser.__module__}.{FakeParser.__qualname__}") is pool
+
+
+def main():
+    tests = [
+        test_extract_zip_reads_resumes,
+        test_extract_zip_skips_oversized_files,
+        test_extract_zip_total_size_cap,
+        test_parse_file_success,
+        test_parse_file_failure,
+        test_parse_bulk_resumes,
+    ]
+    
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    
+    print(f"\n✅ All {len(tests)} bulk upload checks passed!")
+
+
+if __name__ == "__main__":
+    main()
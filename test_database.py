@@ -0,0 +1,215 @@
+"""
+Test script for the Database Manager
+Checks write and search fallbacks against an in-memory stand-in for Supabase
+"""
+
+import database
+from database import SupabaseManager
+from postgrest.exceptions import APIError
+
+
+class FakeResponse:
+    """Result of a fake query"""
+    
+    def __init__(self, data=None):
+        self.data = data
+
+
+class FakeQuery:
+    """Chainable query that records its filters and asks the client for a result"""
+    
+    def __init__(self, client, table, action, payload=None):
+        self.client = client
+        self.table = table
+        self.action = action
+        self.payload = payload
+        self.calls = []
+    
+    def _record(self, name, *args):
+        self.calls.append((name,) + args)
+        return self
+    
+    def select(self, columns, **kwargs):
+        return self._record('select', columns)
+    
+    def eq(self, column, value):
+        return self._record('eq', column, value)
+    
+    def gt(self, column, value):
+        return self._record('gt', column, value)
+    
+    def ilike(self, column, pattern):
+        return self._record('ilike', column, pattern)
+    
+    def order(self, column, desc=False):
+        return self._record('order', column)
+    
+    def range(self, start, end):
+        return self._record('range', start, end)
+    
+    def execute(self):
+        self.client.executed.append(self)
+        return self.client.handler(self)
+
+
+class FakeTable:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+    
+    def select(self, columns, **kwargs):
+        return FakeQuery(self.client, self.name, 'select').select(columns)
+    
+    def insert(self, rows):
+        return FakeQuery(self.client, self.name, 'insert', rows)
+    
+    def upsert(self, rows, on_conflict=None):
+        return FakeQuery(self.client, self.name, 'upsert', rows)
+    
+    def delete(self):
+        return FakeQuery(self.client, self.name, 'delete')
+
+
+class FakeClient:
+    """Supabase client whose queries are answered by handler(query)"""
+    
+    def __init__(self, handler):
+        self.handler = handler
+        self.executed = []
+    
+    def table(self, name):
+        return FakeTable(self, name)
+
+
+def make_manager(handler):
+    """SupabaseManager over a fake client (skips reading secrets)"""
+    db = SupabaseManager.__new__(SupabaseManager)
+    db.client = FakeClient(handler)
+    db.skill_rpc_available = False
+    db.summary_rpc_available = False
+    db.ranking_upsert_available = True
+    db.write_hooks = []
+    return db
+
+
+def test_save_resumes_bulk_partial_failure():
+    """Batches saved before a failing one are returned and the caches cleared"""
+    next_id = iter(range(1, 100))
+    
+    def handler(query):
+        if len(query.client.executed) == 3:
+            raise RuntimeError("connection reset")
+        return FakeResponse([{'id': next(next_id)} for _ in query.payload])
+    
+    db = make_manager(handler)
+    writes = []
+    db.write_hooks.append(lambda: writes.append(True))
+    resumes = [{'filename': f'resume{i}.pdf', 'skills': {}} for i in range(7)]
+    
+    batch_size = database.INSERT_BATCH_SIZE
+    database.INSERT_BATCH_SIZE = 2
+    try:
+        ids = db.save_resumes_bulk(resumes)
+    finally:
+        database.INSERT_BATCH_SIZE = batch_size
+    
+    # Batches 1 and 2 (four resumes) were committed before batch 3 failed
+    assert ids == [1, 2, 3, 4]
+    assert writes == [True]
+
+
+def api_error(code):
+    """PostgREST error carrying a Postgres error code"""
+    return APIError({'message': f'error {code}', 'code': code, 'hint': None, 'details': None})
+
+
+RANKINGS = [
+    {'name': 'Alice', 'email': 'alice@example.com', 'overall_score': 90},
+    {'name': 'Bob', 'email': 'bob@example.com', 'overall_score': 70},
+]
+
+
+def test_save_ranking_falls_back_without_constraint():
+    """42P10 from the upsert switches to delete+insert for good"""
+    def handler(query):
+        if query.action == 'upsert':
+            raise api_error('42P10')
+        return FakeResponse([])
+    
+    db = make_manager(handler)
+    
+    assert db.save_ranking(7, RANKINGS) is True
+    assert db.ranking_upsert_available is False
+    assert [q.action for q in db.client.executed] == ['upsert', 'delete', 'insert']
+    assert db.client.executed[1].calls == [('eq', 'job_posting_id', 7)]
+    
+    # Later saves go straight to delete+insert
+    db.client.executed.clear()
+    assert db.save_ranking(7, RANKINGS) is True
+    assert [q.action for q in db.client.executed] == ['delete', 'insert']
+
+
+def test_save_ranking_trailing_delete_failure():
+    """A failed cleanup after a good upsert is reported, not retried as delete+insert"""
+    def handler(query):
+        if query.action == 'delete':
+            raise api_error('57014')
+        return FakeResponse([])
+    
+    db = make_manager(handler)
+    
+    assert db.save_ranking(7, RANKINGS) is False
+    assert db.ranking_upsert_available is True
+    assert [q.action for q in db.client.executed] == ['upsert', 'delete']
+    assert db.client.executed[1].calls == [('eq', 'job_posting_id', 7), ('gt', 'ranking_position', 2)]
+
+
+def test_search_by_skill_pages_past_false_positives():
+    """Prefilter rows that only match a category name don't use up the limit"""
+    rows = [
+        {'id': 1, 'filename': 'a.pdf', 'parsed_data': {'skills': {'python_tools': ['Excel']}}},
+        {'id': 2, 'filename': 'b.pdf', 'parsed_data': {'skills': {'programming': ['Python']}}},
+        {'id': 3, 'filename': 'c.pdf', 'parsed_data': {'skills': {'python_stack': ['Java']}}},
+        {'id': 4, 'filename': 'd.pdf', 'parsed_data': {'skills': {'programming': ['PYTHON 3']}}},
+        {'id': 5, 'filename': 'e.pdf', 'parsed_data': {'skills': {'programming': ['Python']}}},
+    ]
+    
+    def handler(query):
+        (_, start, end), = [call for call in query.calls if call[0] == 'range']
+        return FakeResponse(rows[start:end + 1])
+    
+    db = make_manager(handler)
+    results = db.search_candidates_by_skill('python', limit=2)
+    
+    assert [r['id'] for r in results] == [2, 4]
+    pages = [call[1:] for q in db.client.executed for call in q.calls if call[0] == 'range']
+    assert pages == [(0, 1), (2, 3)]
+
+
+def test_search_by_skill_escapes_wildcards():
+    """% and _ in the term are matched literally by the prefilter"""
+    db = make_manager(lambda query: FakeResponse([]))
+    
+    assert db.search_candidates_by_skill('c_%', limit=5) == []
+    (query,) = db.client.executed
+    assert ('ilike', 'parsed_data->>skills', '%c\\_\\%%') in query.calls
+
+
+def main():
+    tests = [
+        test_save_resumes_bulk_partial_failure,
+        test_save_ranking_falls_back_without_constraint,
+        test_save_ranking_trailing_delete_failure,
+        test_search_by_skill_pages_past_false_positives,
+        test_search_by_skill_escapes_wildcards,
+    ]
+    
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    
+    print(f"\n✅ All {len(tests)} database checks passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Test script for parallel candidate ranking
+Checks that sharded ranking returns exactly the serial order
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from job_resume_matcher import CandidateRanker, init_rank_worker
+
+JOB_DESCRIPTION = """
+Python Developer
+
+Requirements:
+- 2+ years of Python experience
+- Bachelor's degree in Computer Science
+
+Must Have Skills:
+- Python
+- SQL
+- Machine Learning
+
+Nice to Have:
+- Docker
+- AWS
+"""
+
+SKILL_SETS = [
+    ['Python', 'SQL', 'Machine Learning', 'Docker'],
+    ['Python', 'SQL'],
+    ['Java'],
+    ['Python', 'Machine Learning', 'AWS'],
+]
+
+
+def make_resumes(count):
+    """Synthetic resumes; every fourth one repeats a profile, so scores tie"""
+    resumes = []
+    for i in range(count):
+        resumes.append({
+            'contact': {'name': f'Candidate {i}', 'email': f'candidate{i}@example.com', 'phone': ''},
+            'summary': 'Developer building data pipelines and web services',
+            'skills': {'programming': SKILL_SETS[i % len(SKILL_SETS)]},
+            'experience': [{'description': 'Built Python services backed by SQL databases'}],
+            'education': [{'degree': 'Bachelor of Technology', 'field_of_study': 'Computer Science'}],
+            'projects': [],
+            'total_experience_years': (i % 4) + 1
+        })
+    return resumes
+
+
+def test_parallel_matches_serial():
+    """Same candidates, scores and tie order as rank_candidates"""
+    ranker = CandidateRanker()
+    resumes = make_resumes(24)
+
+    serial = ranker.rank_candidates(resumes, JOB_DESCRIPTION)
+
+    with ProcessPoolExecutor(
+        max_workers=3,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=init_rank_worker
+    ) as pool:
+        parallel = ranker.rank_candidates_parallel(resumes, JOB_DESCRIPTION, pool, max_workers=3)
+
+    assert [c['name'] for c in parallel] == [c['name'] for c in serial]
+    assert [c['overall_score'] for c in parallel] == [c['overall_score'] for c in serial]
+
+    # Resumes are reattached from the caller's list, not unpickled copies
+    assert all(p['resume_data'] is s['resume_data'] for p, s in zip(parallel, serial))
+
+    # The fixture really does contain ties for the order check to cover
+    scores = [c['overall_score'] for c in serial]
+    assert len(set(scores)) < len(scores)
+
+
+def test_small_batch_ranks_serially():
+    """Below the shard threshold the pool is never used"""
+    ranker = CandidateRanker()
+    resumes = make_resumes(3)
+
+    ranked = ranker.rank_candidates_parallel(resumes, JOB_DESCRIPTION, executor=None, max_workers=4)
+    assert [c['name'] for c in ranked] == [c['name'] for c in ranker.rank_candidates(resumes, JOB_DESCRIPTION)]
+
+
+def main():
+    tests = [
+        test_parallel_matches_serial,
+        test_small_batch_ranks_serially,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+    print(f"\n✅ All {len(tests)} ranking checks passed!")
+
+
+if __name__ == "__main__":
+    main()